@@ -128,6 +128,7 @@ from utils.shared.s3_upload_helpers import (
     resolve_max_concurrency,
     normalize_s3_prefix,
     s3_object_matches_local,
+    batch_head_objects,
     parse_uploaded_keys_from_log
 )
 from utils.shared.s3_transfer_config import get_transfer_config, get_boto_config
@@ -147,6 +148,9 @@ FOLDER_TYPE_EXTENSIONS = {
 # Special directory types that should include ALL contents (e.g., .gdb geodatabases)
 INCLUDE_ALL_CONTENTS_DIRS = {".gdb", ".gpkg"}  # File Geodatabases and GeoPackages
 
+# Number of S3 HEAD requests prefetched concurrently per batch during resume checks
+HEAD_BATCH_SIZE = 1000
+
 
 # -----------------------------
 # Helper functions
@@ -510,6 +514,13 @@ def main() -> int:
                     print(f"\n[{folder_type.upper()}] >>> Starting {group_name} (files={len(file_list)})")
                     tracker.start_group(group_name, planned_files=len(file_list))
 
+                    # Prefetch S3 HEAD responses for this group concurrently (in batches)
+                    heads = {}
+                    if not args.force:
+                        group_keys = [key for _, key in file_list]
+                        for i in range(0, len(group_keys), HEAD_BATCH_SIZE):
+                            heads.update(batch_head_objects(s3, bucket, group_keys[i:i + HEAD_BATCH_SIZE]))
+
                     for fpath, key in file_list:
                         size = fpath.stat().st_size
                         ctype = guess_content_type(fpath)
@@ -524,7 +535,8 @@ def main() -> int:
                             match, why = s3_object_matches_local(s3, bucket, key, fpath,
                                                                 tcfg.multipart_threshold,
                                                                 args.skip_large_check,
-                                                                args.verify_large)
+                                                                args.verify_large,
+                                                                head=heads.get(key))
                             if args.debug:
                                 print(f"[DEBUG] S3 HEAD result: match={match}, reason={why}")
                             if match:
@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Tests import the toolbox packages (utils, tools) from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The workflow modules import arcpy at module level, so they only load inside an ArcGIS Pro Python environment
+pytest.importorskip("arcpy")
@@ -0,0 +1,35 @@
+import pytest
+
+from utils.shared.rmi_exceptions import ConfigValidationError
+from utils.validators import common_validators
+
+
+class _Logger:
+    def error(self, message, error_type=None, **kwargs):
+        raise error_type(message)
+
+
+class _Config:
+    def get_logger(self):
+        return _Logger()
+
+
+def test_check_required_keys_reports_first_missing_key_in_list_order():
+    with pytest.raises(ConfigValidationError, match=r"section\.zeta is required"):
+        common_validators.check_required_keys({"beta": 1}, ["zeta", "beta", "alpha"], "section", _Config())
+
+
+def test_resolved_expressions_do_not_outlive_the_validation_scope(monkeypatch):
+    values = {"name": "first"}
+    monkeypatch.setattr(common_validators, "resolve_expression", lambda expr, cfg: values["name"])
+    cfg = _Config()
+
+    with common_validators.resolved_expression_scope(cfg):
+        assert common_validators.try_resolve_config_expression("config.name", "ctx", cfg) == "first"
+        values["name"] = "second"
+        # Within one validation pass the first resolution is reused
+        assert common_validators.try_resolve_config_expression("config.name", "ctx", cfg) == "first"
+
+    # A later validation sees the changed config
+    with common_validators.resolved_expression_scope(cfg):
+        assert common_validators.try_resolve_config_expression("config.name", "ctx", cfg) == "second"
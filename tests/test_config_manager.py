@@ -0,0 +1,22 @@
+from utils.manager.config_manager import ConfigManager
+
+
+def _bare_config(values):
+    cfg = ConfigManager.__new__(ConfigManager)
+    cfg._config = values
+    return cfg
+
+
+def test_filesystem_dependent_validators_are_never_cached():
+    cfg = _bare_config({})
+
+    cacheable = {tool for tool in ConfigManager.TOOL_VALIDATORS if cfg.validation_cacheable(tool)}
+
+    assert {"mosaic_processor", "add_images_to_oid", "apply_exif_metadata", "geocode_images"}.isdisjoint(cacheable)
+    assert "build_oid_schema" in cacheable
+
+
+def test_debug_mode_disables_the_validation_cache():
+    cfg = _bare_config({"debug_messages": True})
+
+    assert not any(cfg.validation_cacheable(tool) for tool in ConfigManager.TOOL_VALIDATORS)
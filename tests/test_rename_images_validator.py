@@ -0,0 +1,36 @@
+import pytest
+
+from utils.shared.rmi_exceptions import ConfigValidationError
+from utils.validators import rename_images_validator
+
+
+class _Logger:
+    def error(self, message, error_type=None, **kwargs):
+        raise error_type(message)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _Config:
+    def __init__(self, filename_settings):
+        self._filename_settings = filename_settings
+
+    def get(self, key, default=None):
+        prefix = "image_output.filename_settings"
+        if key == prefix:
+            return self._filename_settings
+        if key.startswith(prefix + "."):
+            return self._filename_settings.get(key[len(prefix) + 1:], default)
+        return default
+
+    def get_logger(self):
+        return _Logger()
+
+
+def test_unbalanced_brace_in_filename_format_is_rejected(monkeypatch):
+    monkeypatch.setattr(rename_images_validator, "validate_config_section", lambda cfg, path, expected_type: True)
+    cfg = _Config({"format": "{reel}_{frame", "format_no_lr": None, "parts": {"reel": 1, "frame": 2}})
+
+    with pytest.raises(ConfigValidationError, match="not a valid format string"):
+        rename_images_validator.validate(cfg)
@@ -0,0 +1,81 @@
+from contextlib import contextmanager
+
+from utils import step_runner
+from utils.build_step_funcs import build_step_funcs, get_step_order
+
+
+class _Logger:
+    @contextmanager
+    def step(self, *args, **kwargs):
+        yield
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _Config:
+    def __init__(self, values=None):
+        self._values = values or {}
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def get_logger(self):
+        return _Logger()
+
+
+def _recording_steps(ran):
+    step_funcs = build_step_funcs({}, _Config())
+    for key, step in step_funcs.items():
+        step.pop("skip", None)
+        step["func"] = lambda report_data, key=key: ran.append(key)
+    return step_funcs
+
+
+def test_sequential_run_follows_step_order(monkeypatch):
+    monkeypatch.setattr(step_runner, "save_report_json", lambda report_data, cfg: None)
+    ran = []
+    step_funcs = _recording_steps(ran)
+    step_order = get_step_order(step_funcs)
+
+    results = step_runner.run_steps(step_funcs, step_order, 0, {}, {}, _Config({"orchestrator.max_parallel": 1}))
+
+    assert ran == step_order
+    assert [r["status"] for r in results] == ["✅"] * len(step_order)
+
+
+def test_skip_is_checked_after_earlier_steps_run(monkeypatch):
+    monkeypatch.setattr(step_runner, "save_report_json", lambda report_data, cfg: None)
+    params = {}
+    step_funcs = {
+        "first": {"label": "First", "func": lambda report_data: params.update(disable_second=True)},
+        "second": {"label": "Second", "func": lambda report_data: None,
+                   "skip": lambda p: "Disabled by first" if p.get("disable_second") else None},
+    }
+
+    results = step_runner.run_steps(step_funcs, ["first", "second"], 0, params, {}, _Config())
+
+    assert [r["status"] for r in results] == ["✅", "⏭️"]
+    assert results[1]["notes"] == "Disabled by first"
+
+
+def test_resumed_step_marks_its_existing_report_entry(monkeypatch):
+    monkeypatch.setattr(step_runner, "save_report_json", lambda report_data, cfg: None)
+    ran = []
+    step_funcs = {
+        key: {"label": key.title(), "func": lambda report_data, key=key: ran.append(key)}
+        for key in ("first", "second", "third")
+    }
+    report_data = {"steps": [
+        {"name": "First", "status": "✅", "time": "1.0 sec", "notes": "Success"},
+        {"name": "Second", "status": "✅", "time": "1.0 sec", "notes": "Success"},
+    ]}
+
+    step_runner.run_steps(step_funcs, ["first", "second", "third"], 0, {}, report_data,
+                          _Config({"orchestrator.resume_completed": True}))
+
+    # The start step always runs; the other completed step keeps its single entry, marked as resumed
+    assert ran == ["first", "third"]
+    assert [s["name"] for s in report_data["steps"]].count("Second") == 1
+    assert report_data["steps"][1]["status"] == "✅"
+    assert report_data["steps"][1]["resumed"] == "true"
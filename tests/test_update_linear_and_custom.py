@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+from utils import update_linear_and_custom as ulc
+
+
+class _Logger:
+    debug_enabled = False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _ProjectCalled(Exception):
+    pass
+
+
+def _fake_arcpy(calls):
+    def project(in_dataset, out_dataset, out_coor_system):
+        calls["project_out"] = out_dataset
+        raise _ProjectCalled()
+
+    return SimpleNamespace(
+        Describe=lambda fc: SimpleNamespace(spatialReference=SimpleNamespace(factoryCode=3857 if fc == "centerline" else 4326)),
+        ListFields=lambda fc, wildcard=None: [SimpleNamespace(name="JOIN_KEY")],
+        CreateUniqueName=lambda name, workspace: f"{workspace}/{name}0",
+        Exists=lambda item: False,
+        env=SimpleNamespace(scratchGDB="C:/scratch/scratch.gdb"),
+        management=SimpleNamespace(
+            CalculateField=lambda **kwargs: None,
+            GetCount=lambda fc: ["10"],
+            Project=project,
+            Delete=lambda item: None,
+        ),
+    )
+
+
+def test_projected_copy_goes_to_scratch_gdb_for_small_datasets(monkeypatch):
+    calls = {}
+    monkeypatch.setattr(ulc, "arcpy", _fake_arcpy(calls))
+
+    located = ulc.get_located_points("oid_fc", "centerline", "ROUTE_ID", _Logger(), feature_count=10)
+
+    # Project does not support the memory workspace as an output, even below MEMORY_SCRATCH_MAX_FEATURES
+    assert calls["project_out"].startswith("C:/scratch/scratch.gdb/")
+    assert not calls["project_out"].startswith("memory")
+    assert len(located) == 0
@@ -46,7 +46,10 @@ from utils.deploy_lambda_monitor import deploy_lambda_monitor
 from utils.copy_to_aws import copy_to_aws
 from utils.generate_oid_service import generate_oid_service
 
-StepSpec = namedtuple("StepSpec", ["key", "label", "func_builder", "skip_fn"])
+# uses_arcpy: False marks steps that never touch arcpy (geoprocessing, cursors, progressor); only those may run on
+# worker threads when orchestrator.max_parallel is above 1
+StepSpec = namedtuple("StepSpec", ["key", "label", "func_builder", "skip_fn", "depends_on", "uses_arcpy"],
+                      defaults=(True,))
 
 
 
@@ -89,47 +92,50 @@ def build_step_funcs(p, cfg):
         cfg: Configuration object for the pipeline
 
     Returns:
-        dict: A dictionary mapping step keys to descriptors; each descriptor contains 'label' (str), 'func' (callable), and optionally 'skip' (callable)
+        dict: A dictionary mapping step keys to descriptors; each descriptor contains 'label' (str), 'func' (callable),
+        'depends_on' (list of step keys that must finish first), 'uses_arcpy' (bool), and optionally 'skip' (callable)
     """
     step_specs = [
         StepSpec("run_mosaic_processor", "Run Mosaic Processor",
-            lambda params, config: lambda **kwargs: run_mosaic_processor(input_dir=p["input_reels_folder"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: run_mosaic_processor(input_dir=p["input_reels_folder"], cfg=cfg), None, []),
         StepSpec("create_oid", "Create Oriented Imagery Dataset",
-            lambda params, config: lambda **kwargs: create_oriented_imagery_dataset(output_fc_path=p["oid_fc"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: create_oriented_imagery_dataset(output_fc_path=p["oid_fc"], cfg=cfg), None, []),
         StepSpec("add_images", "Add Images to OID",
-            lambda params, config: lambda **kwargs: add_images_to_oid(oid_fc_path=p["oid_fc"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: add_images_to_oid(oid_fc_path=p["oid_fc"], cfg=cfg), None, ["run_mosaic_processor", "create_oid"]),
         StepSpec("assign_group_index", "Assign Group Index",
-            lambda params, config: lambda **kwargs: assign_group_index(oid_fc_path=p["oid_fc"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: assign_group_index(oid_fc_path=p["oid_fc"], cfg=cfg), None, ["add_images"]),
         StepSpec("enrich_oid", "Calculate OID Attributes",
-            lambda params, config: lambda **kwargs: enrich_oid_attributes(oid_fc_path=p["oid_fc"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: enrich_oid_attributes(oid_fc_path=p["oid_fc"], cfg=cfg), None, ["assign_group_index"]),
         StepSpec("smooth_gps", "Smooth GPS Noise",
-            lambda params, config: lambda **kwargs: smooth_gps_noise(oid_fc=p["oid_fc"], centerline_fc=p["centerline_fc"], cfg=cfg), skip_if_smooth_gps_disabled),
+            lambda params, config: lambda **kwargs: smooth_gps_noise(oid_fc=p["oid_fc"], centerline_fc=p["centerline_fc"], cfg=cfg), skip_if_smooth_gps_disabled, ["enrich_oid"]),
         StepSpec("correct_gps", "Correct Flagged GPS Points",
-            lambda params, config: lambda **kwargs: correct_gps_outliers(oid_fc=p["oid_fc"], cfg=cfg), skip_if_smooth_gps_disabled),
+            lambda params, config: lambda **kwargs: correct_gps_outliers(oid_fc=p["oid_fc"], cfg=cfg), skip_if_smooth_gps_disabled, ["smooth_gps"]),
         StepSpec("filter_distance", "Filter Distance Spacing",
-            lambda params, config: lambda **kwargs: filter_distance_spacing(oid_fc=p["oid_fc"], action=p.get("distance_filter_action", "flag"), cfg=cfg), skip_if_distance_filter_disabled),
+            lambda params, config: lambda **kwargs: filter_distance_spacing(oid_fc=p["oid_fc"], action=p.get("distance_filter_action", "flag"), cfg=cfg), skip_if_distance_filter_disabled, ["correct_gps"]),
         StepSpec("update_linear_custom", "Update Linear and Custom Attributes",
-            lambda params, config: lambda **kwargs: update_linear_and_custom(oid_fc_path=p["oid_fc"], centerline_fc=p["centerline_fc"], route_id_field=p["route_id_field"], enable_linear_ref=p["enable_linear_ref"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: update_linear_and_custom(oid_fc_path=p["oid_fc"], centerline_fc=p["centerline_fc"], route_id_field=p["route_id_field"], enable_linear_ref=p["enable_linear_ref"], cfg=cfg), None, ["filter_distance"]),
         StepSpec("rename_images", "Rename Images",
-            lambda params, config: lambda **kwargs: rename_images(oid_fc=p["oid_fc"], cfg=cfg, enable_linear_ref=p["enable_linear_ref"]), None),
+            lambda params, config: lambda **kwargs: rename_images(oid_fc=p["oid_fc"], cfg=cfg, enable_linear_ref=p["enable_linear_ref"]), None, ["update_linear_custom"]),
         StepSpec("update_metadata", "Update EXIF Metadata",
-            lambda params, config: lambda **kwargs: update_metadata_from_config(oid_fc=p["oid_fc"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: update_metadata_from_config(oid_fc=p["oid_fc"], cfg=cfg), None, ["rename_images"]),
         StepSpec("geocode", "Geocode Images",
-            lambda params, config: lambda **kwargs: geocode_images(oid_fc=p["oid_fc"], cfg=cfg), skip_if_geocode_disabled),
+            lambda params, config: lambda **kwargs: geocode_images(oid_fc=p["oid_fc"], cfg=cfg), skip_if_geocode_disabled, ["update_metadata"]),
         StepSpec("build_footprints", "Build OID Footprints",
-            lambda params, config: lambda **kwargs: build_oid_footprints(oid_fc=p["oid_fc"], cfg=cfg), None),
+            lambda params, config: lambda **kwargs: build_oid_footprints(oid_fc=p["oid_fc"], cfg=cfg), None, ["rename_images"]),
         StepSpec("deploy_lambda_monitor", "Deploy Lambda AWS Monitor",
-            lambda params, config: lambda **kwargs: deploy_lambda_monitor(cfg=cfg), skip_if_deploy_lambda_monitor_disabled),
+            lambda params, config: lambda **kwargs: deploy_lambda_monitor(cfg=cfg), skip_if_deploy_lambda_monitor_disabled, ["rename_images"], False),
         StepSpec("copy_to_aws", "Upload to AWS S3",
-            lambda params, config: lambda **kwargs: copy_to_aws(cfg=cfg, **kwargs), skip_if_copy_to_aws_disabled),
+            lambda params, config: lambda **kwargs: copy_to_aws(cfg=cfg, **kwargs), skip_if_copy_to_aws_disabled, ["geocode", "deploy_lambda_monitor"]),
         StepSpec("generate_service", "Generate OID Service",
-            lambda params, config: lambda **kwargs: generate_oid_service(oid_fc=p["oid_fc"], cfg=cfg), skip_if_generate_service_disabled),
+            lambda params, config: lambda **kwargs: generate_oid_service(oid_fc=p["oid_fc"], cfg=cfg), skip_if_generate_service_disabled, ["copy_to_aws", "build_footprints"]),
     ]
     step_funcs = {}
     for spec in step_specs:
         entry = {"label": spec.label, "func": spec.func_builder(p, cfg)}
         if spec.skip_fn:
             entry["skip"] = spec.skip_fn
+        entry["depends_on"] = spec.depends_on
+        entry["uses_arcpy"] = spec.uses_arcpy
         step_funcs[spec.key] = entry
     return step_funcs
 
@@ -18,8 +18,8 @@
 # File Location:        /utils/filter_distance_spacing.py
 # Validator:            /utils/validators/filter_distance_spacing_validator.py
 # Called By:            tools/process_360_orchestrator.py
-# Int. Dependencies:    utils/manager/config_manager
-# Ext. Dependencies:    arcpy, csv, math, typing
+# Int. Dependencies:    utils/manager/config_manager, utils/shared/geo_utils
+# Ext. Dependencies:    arcpy, csv, os, shutil, pathlib, typing
 #
 # Documentation:
 #   See: docs_legacy/TOOL_GUIDES.md
@@ -38,30 +38,9 @@ import os
 import shutil
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
-from math import radians, sin, cos, sqrt, atan2
 
 from utils.manager.config_manager import ConfigManager
-
-
-def haversine(x1, y1, x2, y2):
-    """
-    Calculates the great-circle distance in meters between two latitude/longitude points.
-
-    Args:
-        x1: Longitude of the first point in decimal degrees.
-        y1: Latitude of the first point in decimal degrees.
-        x2: Longitude of the second point in decimal degrees.
-        y2: Latitude of the second point in decimal degrees.
-
-    Returns:
-        The distance between the two points in meters.
-    """
-    r = 6371000  # Earth radius in meters
-    phi1, phi2 = radians(y1), radians(y2)
-    d_phi = radians(y2 - y1)
-    d_lambda = radians(x2 - x1)
-    a = sin(d_phi / 2) ** 2 + cos(phi1) * cos(phi2) * sin(d_lambda / 2) ** 2
-    return r * 2 * atan2(sqrt(a), sqrt(1 - a))
+from utils.shared.geo_utils import haversine
 
 
 def analyze_spacing_by_reel(
@@ -18,7 +18,7 @@
 # Called By:            ArcGIS tools, orchestrators, log initializers
 # Int. Dependencies:    utils/manager/path_manager, utils/manager/log_manager, utils/validate_full_config,
 #                       utils/expression_utils, utils/exceptions, utils/validators
-# Ext. Dependencies:    yaml, pathlib, typing, os
+# Ext. Dependencies:    yaml, pathlib, typing, os, hashlib, json, collections, functools
 #
 # Documentation:
 #   See: docs_legacy/CONFIG_MANAGER.md
@@ -31,8 +31,12 @@
 # =============================================================================
 
 from __future__ import annotations
+import hashlib
+import json
 import os
 import yaml
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Optional, Union, Dict, List, TYPE_CHECKING
 from pathlib import Path
 
@@ -44,6 +48,7 @@ if TYPE_CHECKING:
 from utils.validators.validate_full_config import validate_full_config
 from utils.shared.rmi_exceptions import ConfigValidationError
 from utils.shared.expression_utils import resolve_expression
+from utils.validators.common_validators import resolved_expression_scope
 
 from utils.validators import (
     mosaic_processor_validator,
@@ -67,6 +72,16 @@ from utils.validators import (
 
 SUPPORTED_SCHEMA_VERSIONS = {"1.3.1"}
 
+# Tool validations that passed, keyed by (tool, config digest); most recently used last
+_VALIDATION_CACHE: "OrderedDict[tuple, bool]" = OrderedDict()
+_VALIDATION_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=1024)
+def _split_key_path(key_path: str) -> tuple:
+    """Splits a dot-separated config key path once; key paths are mostly literals repeated across calls."""
+    return tuple(key_path.split("."))
+
 
 class ConfigManager:
     """
@@ -224,12 +239,14 @@ class ConfigManager:
             ValueError: If the configuration fails validation.
         """
         try:
-            if tool:
-                self.validate_tool_config(tool)
-            else:
-                result = validate_full_config(self)
-                if result is False:
-                    raise ValueError("Full config validation failed.")
+            # Expression resolutions are shared across validators only within this call; the config may change after
+            with resolved_expression_scope(self):
+                if tool:
+                    self.validate_tool_config(tool)
+                else:
+                    result = validate_full_config(self)
+                    if result is False:
+                        raise ValueError("Full config validation failed.")
         except ConfigValidationError as e:
             raise ValueError(f"Validation failed for tool '{tool}': {e}") from e
 
@@ -284,9 +301,8 @@ class ConfigManager:
             cfg.get("nonexistent.key", "fallback")
                 "fallback"
         """
-        keys = key_path.split(".")
         value = self._config
-        for key in keys:
+        for key in _split_key_path(key_path):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
@@ -397,21 +413,58 @@ class ConfigManager:
         "generate_oid_service": generate_oid_service_validator.validate
     }
 
-    def validate_tool_config(self, tool: str):
+    def validate_tool_config(self, tool: str, digest: Optional[str] = None):
         """
         Validates the configuration for a specified tool using its registered validator.
 
-        If the tool name is not recognized, logs an error and signals a configuration validation failure.
+        If the tool name is not recognized, logs an error and signals a configuration validation failure. A tool that
+        already passed against the same config contents in this session is not re-validated, unless debug_messages is
+        enabled or its validator checks files on disk (see validation_cacheable).
 
         Args:
             tool: The name of the tool whose configuration should be validated.
+            digest: Precomputed validation_digest(), so callers validating several tools hash the config once.
 
         Raises:
             ConfigValidationError: If the tool name is not registered.
         """
         logger = self.get_logger()
 
-        if tool in self.TOOL_VALIDATORS:
-            self.TOOL_VALIDATORS[tool](self)
-        else:
+        if tool not in self.TOOL_VALIDATORS:
             logger.error(f"Unknown tool '{tool}'", error_type=ConfigValidationError)
+            return
+
+        # Skip tools that already passed against identical config contents (always re-run in debug mode)
+        use_cache = self.validation_cacheable(tool)
+        cache_key = (tool, digest or self.validation_digest()) if use_cache else None
+        if cache_key in _VALIDATION_CACHE:
+            _VALIDATION_CACHE.move_to_end(cache_key)
+            return
+
+        result = self.TOOL_VALIDATORS[tool](self)
+        if use_cache and result is not False:
+            _VALIDATION_CACHE[cache_key] = True
+            if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+                _VALIDATION_CACHE.popitem(last=False)
+
+    def validation_cacheable(self, tool: str) -> bool:
+        """
+        Returns whether a passing validation of the given tool may be reused for identical config contents. Validators
+        marked @filesystem_dependent probe files or executables on disk and always re-run, as does every validator
+        when debug_messages is enabled.
+        """
+        validator = self.TOOL_VALIDATORS.get(tool)
+        return (validator is not None and not getattr(validator, "uses_filesystem", False)
+                and not self.get("debug_messages", False))
+
+    def validation_digest(self) -> str:
+        """
+        Returns a SHA-256 digest of the config contents and the field registry's modification time, identifying the
+        inputs a tool validation depends on.
+        """
+        try:
+            registry_mtime = os.path.getmtime(self.paths.oid_field_registry)
+        except (OSError, TypeError, AttributeError):
+            registry_mtime = None
+        payload = json.dumps([self._config, registry_mtime], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -17,7 +17,7 @@
 # File Location:        /utils/manager/log_manager.py
 # Called By:            Tools, orchestrators, testing pipelines
 # Int. Dependencies:    utils/manager/path_manager
-# Ext. Dependencies:    json, time, html, contextlib, typing, datetime
+# Ext. Dependencies:    json, time, html, threading, contextlib, typing, datetime
 #
 # Documentation:
 #   See: docs_legacy/LOG_MANAGER.md
@@ -36,6 +36,7 @@ from contextlib import contextmanager
 import time
 import html
 import json
+import threading
 from utils.manager.path_manager import PathManager
 
 class LogManager:
@@ -49,6 +50,9 @@ class LogManager:
     - ArcGIS Pro messaging (if a message object is provided)
     - Export to .txt, .html, and .json files via PathManager
 
+    Safe to share between threads: step and context stacks are tracked per thread, and each message is recorded and
+    written under a lock so concurrent steps do not interleave partial output.
+
     Designed for use in orchestration scripts, CLI tools, and ArcGIS Python Toolbox tools.
     
     """
@@ -91,8 +95,29 @@ class LogManager:
         self.records: List[Dict] = []
         self.depth = 0
         self.indent_char = "    "
-        self._timing_stack: List[float] = []
-        self._context_stack: List[Optional[Dict]] = []
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def _context_stack(self) -> List[Optional[Dict]]:
+        """Context stack of the calling thread, so steps running on other threads do not see each other's context."""
+        stack = getattr(self._local, "context_stack", None)
+        if stack is None:
+            stack = self._local.context_stack = []
+        return stack
+
+    @property
+    def _timing_stack(self) -> List[float]:
+        """Step timing stack of the calling thread."""
+        stack = getattr(self._local, "timing_stack", None)
+        if stack is None:
+            stack = self._local.timing_stack = []
+        return stack
+
+    @property
+    def debug_enabled(self) -> bool:
+        """True when debug_messages is set, i.e. when debug() calls produce output."""
+        return bool(self.config.get("debug_messages", False))
 
     def log(self, msg: str, level: str = "info", context: Optional[Dict] = None, indent: int = 0,
             error_type: Optional[Type[Exception]] = None, emoji: Optional[str] = None) -> None:
@@ -115,7 +140,7 @@ class LogManager:
             self.log(f"⚠️ Invalid log level '{level}' (defaulting to info)", level="warning", indent=indent)
             level = "info"
 
-        if level == "debug" and not self.config.get("debug_messages", False):
+        if level == "debug" and not self.debug_enabled:
             return
 
         # Use context from stack if not provided
@@ -137,71 +162,72 @@ class LogManager:
             if self.config.get("debug_messages", False) and self.SHOW_CONTEXT_IN_DEBUG:
                 context_str = "  " + " ".join(f"{k}={v}" for k, v in context.items())
 
-        indent_str = self.indent_char * indent
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        iso_timestamp = datetime.now().isoformat()
-        full_msg = f"[{timestamp}] {prefix} {indent_str}{msg}{context_str}"
-        self.entries.append(full_msg)
-
-        self.records.append({
-            "timestamp": iso_timestamp,
-            "level": level,
-            "message": msg,
-            "indent": indent,
-            "context": context or {}
-        })
-
-        css_class = level
-        # Enhanced HTML log generation for indentation and collapsibility
-        # Use <details>/<summary> for steps (indent=0 with separator), .block for indented messages
-        if not hasattr(self, '_open_details'):
-            self._open_details = False
-        html_line = None
-        if indent == 0 and (msg.strip() == '=' * 40 or (level == 'custom' and emoji == '▶️')):
-            # Start or end of a step, use <details>/<summary>
-            if msg.strip() == '=' * 40:
-                # Separator, close previous <details> if open
-                if self._open_details:
-                    self.html_blocks.append('</div></details>')
-                    self._open_details = False
-            else:
-                # Start a new collapsible block for the step
-                if self._open_details:
-                    self.html_blocks.append('</div></details>')
-                summary = html.escape(msg + (context_str if context_str else ''))
-                self.html_blocks.append(f'<details open><summary><span class="ts">[{timestamp}]</span> {prefix} {summary}</summary><div class="block">')
-                self._open_details = True
-            # Do not add the separator/step message as a normal line
+        with self._lock:
+            indent_str = self.indent_char * indent
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            iso_timestamp = datetime.now().isoformat()
+            full_msg = f"[{timestamp}] {prefix} {indent_str}{msg}{context_str}"
+            self.entries.append(full_msg)
+
+            self.records.append({
+                "timestamp": iso_timestamp,
+                "level": level,
+                "message": msg,
+                "indent": indent,
+                "context": context or {}
+            })
+
+            css_class = level
+            # Enhanced HTML log generation for indentation and collapsibility
+            # Use <details>/<summary> for steps (indent=0 with separator), .block for indented messages
+            if not hasattr(self, '_open_details'):
+                self._open_details = False
             html_line = None
-        else:
-            block_class = 'block' if indent > 0 else ''
-            html_line = f'<div class="{css_class} {block_class}"><span class="ts">[{timestamp}]</span> {prefix} {html.escape(msg + context_str)}</div>'
-        if html_line:
-            self.html_blocks.append(html_line)
-
-
-        if self.messages:
-            if level == "warning" and hasattr(self.messages, "addWarningMessage"):
-                self.messages.addWarningMessage(full_msg)
-            elif level == "error" and hasattr(self.messages, "addErrorMessage"):
-                self.messages.addErrorMessage(full_msg)
-            elif hasattr(self.messages, "addMessage"):
-                self.messages.addMessage(full_msg)
-        else:
-            print(full_msg)
-
-        if self.enable_file_output and self.path_manager:
-            try:
-                log_file = self.path_manager.logs / "process_log.txt"
-                log_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(log_file, "a", encoding="utf-8") as f:
-                    f.write(full_msg + "\n")
-            except Exception as e:
-                if level == "warning":
-                    print(f"⚠️ Could not write to log file: {e}")
+            if indent == 0 and (msg.strip() == '=' * 40 or (level == 'custom' and emoji == '▶️')):
+                # Start or end of a step, use <details>/<summary>
+                if msg.strip() == '=' * 40:
+                    # Separator, close previous <details> if open
+                    if self._open_details:
+                        self.html_blocks.append('</div></details>')
+                        self._open_details = False
                 else:
-                    # Avoid recursion
-                    print(f"Could not write to log file: {e}")
+                    # Start a new collapsible block for the step
+                    if self._open_details:
+                        self.html_blocks.append('</div></details>')
+                    summary = html.escape(msg + (context_str if context_str else ''))
+                    self.html_blocks.append(f'<details open><summary><span class="ts">[{timestamp}]</span> {prefix} {summary}</summary><div class="block">')
+                    self._open_details = True
+                # Do not add the separator/step message as a normal line
+                html_line = None
+            else:
+                block_class = 'block' if indent > 0 else ''
+                html_line = f'<div class="{css_class} {block_class}"><span class="ts">[{timestamp}]</span> {prefix} {html.escape(msg + context_str)}</div>'
+            if html_line:
+                self.html_blocks.append(html_line)
+
+
+            if self.messages:
+                if level == "warning" and hasattr(self.messages, "addWarningMessage"):
+                    self.messages.addWarningMessage(full_msg)
+                elif level == "error" and hasattr(self.messages, "addErrorMessage"):
+                    self.messages.addErrorMessage(full_msg)
+                elif hasattr(self.messages, "addMessage"):
+                    self.messages.addMessage(full_msg)
+            else:
+                print(full_msg)
+
+            if self.enable_file_output and self.path_manager:
+                try:
+                    log_file = self.path_manager.logs / "process_log.txt"
+                    log_file.parent.mkdir(parents=True, exist_ok=True)
+                    with open(log_file, "a", encoding="utf-8") as f:
+                        f.write(full_msg + "\n")
+                except Exception as e:
+                    if level == "warning":
+                        print(f"⚠️ Could not write to log file: {e}")
+                    else:
+                        # Avoid recursion
+                        print(f"Could not write to log file: {e}")
 
         if level == "error" and error_type:
             raise error_type(full_msg)
@@ -41,6 +41,10 @@ if TYPE_CHECKING:
 
 __all__ = ["PathManager"]
 
+# (executable, test args) -> modification time of the resolved executable for probes that ran successfully; a hit
+# only counts while the executable on disk is unchanged, and failures are always re-probed
+_AVAILABLE_EXECUTABLES: dict = {}
+
 class PathManager:
     """
     Central path manager for RMI 360 Workflow.
@@ -383,7 +387,9 @@ class PathManager:
     @staticmethod
     def _is_executable_available(exe_path: str, test_args: list[str] = None) -> bool:
         """
-        Returns True if the given executable runs without error.
+        Returns True if the given executable runs without error. A successful probe is remembered while the resolved
+        executable's modification time is unchanged, so validators and tools that check the same executable only
+        launch it once, and a removed, moved or replaced executable is probed again.
 
         Args:
             exe_path (str): Path to the executable to test
@@ -396,6 +402,18 @@ class PathManager:
         if test_args is None:
             test_args = ["-ver"]
 
+        probe_key = (str(exe_path), tuple(test_args))
+        resolved = shutil.which(str(exe_path))
+        if not resolved:
+            _AVAILABLE_EXECUTABLES.pop(probe_key, None)
+            return False
+        try:
+            stamp = os.path.getmtime(resolved)
+        except OSError:
+            stamp = None
+        if stamp is not None and _AVAILABLE_EXECUTABLES.get(probe_key) == stamp:
+            return True
+
         # Handle platform-specific issues
         startupinfo = None
         if os.name == 'nt':  # Windows
@@ -403,9 +421,6 @@ class PathManager:
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 
-        if not shutil.which(str(exe_path)):
-            return False
-
         try:
             result = subprocess.run(
                 [exe_path] + test_args, 
@@ -416,8 +431,14 @@ class PathManager:
                 startupinfo=startupinfo,
                 timeout=5  # Add timeout to prevent hanging
             )
-            return result.returncode == 0
+            if result.returncode != 0:
+                _AVAILABLE_EXECUTABLES.pop(probe_key, None)
+                return False
+            if stamp is not None:
+                _AVAILABLE_EXECUTABLES[probe_key] = stamp
+            return True
         except (FileNotFoundError, PermissionError, OSError, subprocess.TimeoutExpired):
+            _AVAILABLE_EXECUTABLES.pop(probe_key, None)
             return False
 
     @classmethod
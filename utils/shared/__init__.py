@@ -4,15 +4,17 @@ from . import check_disk_space
 from . import rmi_exceptions
 from . import expression_utils
 from . import folder_stats
+from . import geo_utils
 from . import gather_metrics
 from . import report_data_builder
+from . import route_index
 from . import schema_validator
 from . import s3_upload_helpers
 from . import s3_transfer_config
 from . import s3_status_tracker
 
 __all__ = []
-for mod in [arcpy_utils, aws_utils, check_disk_space, rmi_exceptions, expression_utils, folder_stats, gather_metrics,
-            report_data_builder, schema_validator, s3_upload_helpers, s3_transfer_config, s3_status_tracker]:
+for mod in [arcpy_utils, aws_utils, check_disk_space, rmi_exceptions, expression_utils, folder_stats, geo_utils,
+            gather_metrics, report_data_builder, route_index, schema_validator, s3_upload_helpers, s3_transfer_config, s3_status_tracker]:
     __all__.extend([name for name in dir(mod) if not name.startswith('_')])
     globals().update({name: getattr(mod, name) for name in dir(mod) if not name.startswith('_')})
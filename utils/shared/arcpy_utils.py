@@ -15,7 +15,7 @@
 # File Location:        /utils/arcpy_utils.py
 # Called By:            Multiple tools and utilities throughout the pipeline
 # Int. Dependencies:    utils/manager/config_manager, utils/manager/log_manager
-# Ext. Dependencies:    arcpy, datetime, pathlib, typing
+# Ext. Dependencies:    arcpy, datetime, os, pathlib, typing
 #
 # Documentation:
 #   See: docs_legacy/UTILITIES.md and internal docstrings
@@ -27,6 +27,7 @@
 # =============================================================================
 
 from __future__ import annotations
+import os
 import arcpy
 from pathlib import Path
 from datetime import datetime
@@ -36,6 +37,9 @@ if TYPE_CHECKING:
     from utils.manager.log_manager import LogManager
     from utils.manager.config_manager import ConfigManager
 
+# Shapefile component files whose modification times make up its workspace stamp
+SHAPEFILE_STAMP_EXTENSIONS = (".shp", ".shx", ".dbf")
+
 
 def validate_fields_exist(
     feature_class: str,
@@ -67,6 +71,40 @@ def validate_fields_exist(
             raise ValueError(msg)
 
 
+def workspace_stamp(dataset: Union[str, Path]) -> Optional[float]:
+    """
+    Returns a modification stamp for a file geodatabase or shapefile dataset, or None if it cannot be stamped.
+
+    For a shapefile the stamp is the latest modification time of its .shp/.shx/.dbf files. For a file geodatabase
+    feature class (also inside a feature dataset) it is the latest modification time of the geodatabase's .gdbtable
+    files, which are rewritten whenever a table is edited. Any other workspace (enterprise .sde connections, memory,
+    services) returns None, which callers treat as "do not cache".
+    """
+    path = str(dataset)
+    root = path[:-4] if path.lower().endswith(".shp") else path
+    if os.path.isfile(root + ".shp"):
+        try:
+            return max(os.path.getmtime(root + ext) for ext in SHAPEFILE_STAMP_EXTENSIONS
+                       if os.path.isfile(root + ext))
+        except OSError:
+            return None
+
+    # Walk up from the feature class (or feature dataset) to the .gdb folder
+    workspace = os.path.dirname(path)
+    while workspace and not workspace.lower().endswith(".gdb"):
+        parent = os.path.dirname(workspace)
+        if parent == workspace:
+            return None
+        workspace = parent
+    if not workspace or not os.path.isdir(workspace):
+        return None
+    try:
+        with os.scandir(workspace) as entries:
+            return max((e.stat().st_mtime for e in entries if e.name.endswith(".gdbtable")), default=None)
+    except OSError:
+        return None
+
+
 def str_to_bool(val: Any) -> bool:
     """
     Converts a value to a native Python boolean.
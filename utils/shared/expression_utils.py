@@ -11,7 +11,8 @@
 # Description:
 #   Provides utility functions to resolve expressions defined in YAML config or field registry.
 #   Supports nested dot-path lookups, type conversion, formatting modifiers, concatenation,
-#   and special keywords like `now.year`. Also loads and validates OID field registry schemas.
+#   and special keywords like `now.year`. Expressions can be compiled once for repeated per-row evaluation.
+#   Also loads and validates OID field registry schemas.
 #
 # File Location:        /utils/expression_utils.py
 # Called By:            validate_full_config.py, most workflow steps
@@ -31,20 +32,29 @@ from __future__ import annotations
 import os
 import yaml
 from datetime import datetime
-from typing import Union, Optional, Any, TYPE_CHECKING
+from typing import Union, Optional, Any, Callable, Dict, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from utils.manager.config_manager import ConfigManager
 
 REQUIRED_REGISTRY_KEYS = {"name", "type", "length", "alias", "category", "expr", "oid_default", "orientation_format"}
 
+# Validated field registries keyed by file path -> (modification time, registry)
+_REGISTRY_CACHE: Dict[str, Tuple[float, dict]] = {}
+
+
+def clear_field_registry_cache() -> None:
+    """Discards all cached field registries so the next load re-reads the YAML file."""
+    _REGISTRY_CACHE.clear()
+
 
 def load_field_registry(cfg: "ConfigManager", category_filter: Optional[str] = None) -> dict:
     """
     Loads and validates a field registry from a YAML file.
 
     The registry is checked for required keys in each field entry and optionally filtered by category. Raises an error
-    if the file is missing, cannot be parsed as a dictionary, or if required keys are absent.
+    if the file is missing, cannot be parsed as a dictionary, or if required keys are absent. The validated registry is
+    cached by file path and modification time, so repeated loads within a session skip parsing.
 
     Args:
         cfg: ConfigManager instance used to resolve config-based expressions.
@@ -66,6 +76,31 @@ def load_field_registry(cfg: "ConfigManager", category_filter: Optional[str] = N
         logger.error(f"Field registry file does not exist: {registry_path}", error_type=FileNotFoundError)
         return {}
 
+    # Reuse the validated registry while the file is unchanged
+    cache_key = str(registry_path)
+    mtime = os.path.getmtime(registry_path)
+    cached = _REGISTRY_CACHE.get(cache_key)
+    if cached and cached[0] == mtime:
+        registry = cached[1]
+    else:
+        registry = _read_field_registry(registry_path, logger)
+        if not registry:
+            return {}
+        _REGISTRY_CACHE[cache_key] = (mtime, registry)
+
+    return {
+        key: field for key, field in registry.items()
+        if not category_filter or field.get("category") == category_filter
+    }
+
+
+def _read_field_registry(registry_path, logger) -> dict:
+    """
+    Parses the registry YAML and validates that each entry is a dictionary with the required keys.
+
+    Returns:
+        The full (unfiltered) registry, or an empty dict if it did not parse as a dictionary.
+    """
     with open(registry_path, "r", encoding="utf-8") as f:
         registry = yaml.safe_load(f)
 
@@ -86,9 +121,6 @@ def load_field_registry(cfg: "ConfigManager", category_filter: Optional[str] = N
             if missing:
                 logger.error(f"Field '{key}' missing required keys: {sorted(missing)}", error_type=ValueError)
 
-        if category_filter and field.get("category") != category_filter:
-            continue
-
         validated[key] = field
 
     return validated
@@ -132,6 +164,64 @@ def resolve_expression(expr: Union[str, float, int], cfg: "ConfigManager", row:
     return expr
 
 
+def compile_expression(expr: Union[str, float, int], cfg: "ConfigManager") -> Callable[[Optional[dict]], Any]:
+    """
+    Parses an expression once and returns a resolver equivalent to `resolve_expression(expr, cfg, row=row)`.
+
+    The expression string is split into its concatenated parts, field names, and modifiers up front, so per-row
+    evaluation only looks up values and applies modifiers. Config expressions are resolved on first use and reused.
+
+    Args:
+        expr: The expression to compile, which may be a string, float, or integer.
+        cfg: ConfigManager instance used to resolve config-based expressions.
+
+    Returns:
+        A callable taking an optional row dictionary and returning the resolved value.
+    """
+    if not isinstance(expr, str):
+        literal = str(expr)
+        return lambda row=None: literal
+
+    if " + " in expr:
+        parts = [compile_expression(p.strip(), cfg) for p in expr.split("+")]
+        return lambda row=None: "".join(str(part(row)) for part in parts)
+
+    fallback = _compile_literal_expr(expr, cfg)
+    if expr.startswith("field."):
+        base, *mods = expr[6:].split(".")
+
+        def resolve_field(row=None):
+            if row is None:
+                return fallback(row)
+            value = row.get(base)
+            return "" if value is None else _apply_field_modifiers(value, mods)
+
+        return resolve_field
+    return fallback
+
+
+def _compile_literal_expr(expr: str, cfg: "ConfigManager") -> Callable[[Optional[dict]], Any]:
+    """Compiles the row-independent expression forms (config lookups, now.year, quoted and bare literals)."""
+    if expr.startswith("config."):
+        resolved = []
+
+        def resolve_config(row=None):
+            if not resolved:
+                resolved.append(_resolve_config_expr(expr[7:], cfg))
+            return resolved[0]
+
+        return resolve_config
+
+    if expr == "now.year":
+        return lambda row=None: str(datetime.now().year)
+
+    if (expr.startswith("'") and expr.endswith("'")) or (expr.startswith('"') and expr.endswith('"')):
+        literal = expr[1:-1]
+        return lambda row=None: literal
+
+    return lambda row=None: expr
+
+
 def _resolve_field_expr(expr: str, row: dict) -> str:
     """
     Resolves a field expression from a row dictionary, applying optional modifiers.
@@ -145,6 +235,11 @@ def _resolve_field_expr(expr: str, row: dict) -> str:
     if value is None:
         return ""
 
+    return _apply_field_modifiers(value, mods)
+
+
+def _apply_field_modifiers(value: Any, mods: List[str]) -> Any:
+    """Applies field expression modifiers (float, int, date, strip, upper, lower) to a row value in order."""
     for mod in mods:
         if mod.startswith("float("):
             precision = int(mod[6:-1])
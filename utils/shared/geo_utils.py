@@ -0,0 +1,76 @@
+# =============================================================================
+# 🌐 Geodesic Distance Helpers (utils/shared/geo_utils.py)
+# -----------------------------------------------------------------------------
+# Purpose:             Great-circle distance calculations shared by the GPS processing steps
+# Project:             RMI 360 Imaging Workflow Python Toolbox
+# Version:             1.0.0
+# Author:              RMI Valuation, LLC
+# Created:             2025-05-20
+# Last Updated:        2025-05-20
+#
+# Description:
+#   Provides scalar and vectorized haversine distances (in meters) between longitude/latitude points.
+#   Used by the GPS smoothing and distance spacing filters so both steps measure distance the same way.
+#
+# File Location:        /utils/shared/geo_utils.py
+# Called By:            utils/smooth_gps_noise.py, utils/filter_distance_spacing.py
+# Int. Dependencies:    None
+# Ext. Dependencies:    math, numpy
+#
+# Documentation:
+#   See: docs_legacy/UTILITIES.md
+#   (Ensure this doc is current; update if needed.)
+#
+# Notes:
+#   - Inputs are WGS84 decimal degrees; distances use the mean Earth radius (6,371 km)
+# =============================================================================
+
+__all__ = ["EARTH_DIAMETER_M", "haversine", "haversine_np"]
+
+import numpy as np
+from math import radians, sin, cos, sqrt, atan2
+
+EARTH_DIAMETER_M = 2 * 6371000.0  # Twice the mean Earth radius, in meters
+
+
+def haversine(x1, y1, x2, y2, _radians=radians, _sin=sin, _cos=cos, _sqrt=sqrt, _atan2=atan2):
+    """
+    Calculates the great-circle distance in meters between two latitude/longitude points.
+
+    Args:
+        x1: Longitude of the first point in decimal degrees.
+        y1: Latitude of the first point in decimal degrees.
+        x2: Longitude of the second point in decimal degrees.
+        y2: Latitude of the second point in decimal degrees.
+
+    Returns:
+        The distance between the two points in meters.
+
+    Note:
+        The math functions are bound as default arguments so each call resolves them as locals.
+    """
+    phi1, phi2 = _radians(y1), _radians(y2)
+    d_phi = _radians(y2 - y1)
+    d_lambda = _radians(x2 - x1)
+    a = _sin(d_phi / 2) ** 2 + _cos(phi1) * _cos(phi2) * _sin(d_lambda / 2) ** 2
+    return EARTH_DIAMETER_M * _atan2(_sqrt(a), _sqrt(1 - a))
+
+
+def haversine_np(x1, y1, x2, y2) -> np.ndarray:
+    """
+    Vectorized great-circle distance in meters between arrays of longitude/latitude points.
+
+    Args:
+        x1: Longitudes of the first points in decimal degrees.
+        y1: Latitudes of the first points in decimal degrees.
+        x2: Longitudes of the second points in decimal degrees.
+        y2: Latitudes of the second points in decimal degrees.
+
+    Returns:
+        Array of distances in meters.
+    """
+    phi1, phi2 = np.radians(y1), np.radians(y2)
+    d_phi = np.radians(y2 - y1)
+    d_lambda = np.radians(x2 - x1)
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return EARTH_DIAMETER_M * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
@@ -16,7 +16,7 @@
 # File Location:        /utils/report_data_builder.py
 # Called By:            orchestrator, generate_report.py, progress dashboard
 # Int. Dependencies:    utils/manager/config_manager
-# Ext. Dependencies:    json, typing
+# Ext. Dependencies:    json, orjson (optional), os, shutil, tempfile, time, pathlib, typing
 #
 # Documentation:
 #   See: docs_legacy/UTILITIES.md and docs_legacy/tools/process_360_orchestrator.md
@@ -27,10 +27,26 @@
 # =============================================================================
 
 import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
 from typing import Dict, Optional, Any
 
 from utils.manager.config_manager import ConfigManager
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+# Attempts (and the delay between them) for replacing a report another process holds open on Windows
+REPLACE_RETRIES = 5
+REPLACE_RETRY_DELAY_SEC = 0.2
+
 
 def resolve_if_expression(val: Any, cfg: ConfigManager) -> Any:
     """
@@ -105,10 +121,46 @@ def initialize_report_data(paths_dict: Dict[str, Any], cfg: ConfigManager) -> Di
     }
     return report_data
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Writes data to a temp file in the target directory, fsyncs it, and renames it over path.
+
+    The temp file is created with mode 0600, so an existing target's permissions are copied onto it first. On Windows
+    the rename fails while another process (virus scanner, viewer) has the target open; it is retried briefly.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        for attempt in range(REPLACE_RETRIES):
+            try:
+                os.replace(tmp_path, path)
+                return
+            except PermissionError:
+                if attempt == REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(REPLACE_RETRY_DELAY_SEC)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
 def save_report_json(report_data: Dict[str, Any], cfg: ConfigManager, logger: Optional[Any] = None) -> Optional[str]:
     """
     Saves the report data dictionary as a JSON file in the project's report directory.
 
+    Uses orjson when it is installed (same indented, UTF-8 output) and the stdlib json encoder otherwise. The file is
+    replaced atomically, so an interrupted save never leaves a truncated report behind for resumed runs.
+
     Args:
         report_data: The report data dictionary to save.
         cfg: The configuration manager.
@@ -126,8 +178,11 @@ def save_report_json(report_data: Dict[str, Any], cfg: ConfigManager, logger: Op
         json_filename = f"report_data_{slug}.json"
         out_path = report_dir / json_filename
 
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            payload = orjson.dumps(report_data, option=_ORJSON_OPTIONS)
+        else:
+            payload = json.dumps(report_data, indent=2, ensure_ascii=False).encode("utf-8")
+        _atomic_write_bytes(out_path, payload)
 
         logger.custom(f"Saved report JSON to: {out_path}", emoji="📄", indent=1)
         return str(out_path)
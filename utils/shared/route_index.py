@@ -0,0 +1,109 @@
+# =============================================================================
+# 🛣️ Centerline Spatial Index (utils/shared/route_index.py)
+# -----------------------------------------------------------------------------
+# Purpose:             Batched nearest-centerline distance lookups for point arrays
+# Project:             RMI 360 Imaging Workflow Python Toolbox
+# Version:             1.0.0
+# Author:              RMI Valuation, LLC
+# Created:             2025-05-20
+# Last Updated:        2025-05-20
+#
+# Description:
+#   Densifies centerline geometries into a KD-tree of vertices and computes the exact distance from
+#   each projected point to the nearest centerline segment in a single vectorized query. Replaces
+#   per-point queryPointAndDistance loops when SciPy is available.
+#
+# File Location:        /utils/shared/route_index.py
+# Called By:            utils/smooth_gps_noise.py, utils/update_linear_and_custom.py
+# Int. Dependencies:    None
+# Ext. Dependencies:    numpy, scipy (optional), typing
+#
+# Documentation:
+#   See: docs_legacy/UTILITIES.md
+#   (Ensure this doc is current; update if needed.)
+#
+# Notes:
+#   - build_route_index returns None when SciPy is missing or the centerline is not projected;
+#     callers keep their own ArcPy fallback for that case
+# =============================================================================
+
+__all__ = ["build_route_index", "route_distances"]
+
+import numpy as np
+from typing import Optional
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # Callers fall back to ArcPy distance queries
+    cKDTree = None
+
+# Vertex spacing (meters) used when densifying centerlines for the spatial index, and the number of
+# nearest vertices whose adjacent segments are checked for the exact point-to-segment distance.
+ROUTE_DENSIFY_M = 1.0
+ROUTE_INDEX_NEIGHBORS = 4
+
+
+def build_route_index(routes, route_sr, logger) -> Optional[dict]:
+    """
+    Builds a KD-tree over densified centerline vertices for batched nearest-distance lookups.
+
+    Returns:
+        Dict with the tree, vertex array and a mask of vertices that start a segment, or None if SciPy is
+        unavailable or the routes cannot be densified (callers then fall back to ArcPy distance queries).
+    """
+    if cKDTree is None or not routes:
+        return None
+
+    meters_per_unit = getattr(route_sr, "metersPerUnit", None)
+    if getattr(route_sr, "type", None) != "Projected" or not meters_per_unit:
+        logger.debug("Centerline spatial reference is not projected; using ArcPy route distance queries.", indent=1)
+        return None
+
+    verts = []
+    has_next = []
+    try:
+        densify_dist = ROUTE_DENSIFY_M / meters_per_unit
+        for route in routes:
+            for part in route.densify("DISTANCE", densify_dist):
+                part_pts = [(pt.X, pt.Y) for pt in part if pt]
+                verts.extend(part_pts)
+                has_next.extend([True] * (len(part_pts) - 1) + [False] * bool(part_pts))
+    except Exception as e:
+        logger.warning(f"Could not densify centerline for spatial index; using ArcPy queries: {e}", indent=1)
+        return None
+
+    if not verts:
+        return None
+    verts = np.asarray(verts, dtype=np.float64)
+    return {"tree": cKDTree(verts), "verts": verts, "has_next": np.asarray(has_next, dtype=bool)}
+
+
+def route_distances(route_index: dict, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+    """
+    Computes the distance from each projected point to the nearest centerline segment.
+
+    The KD-tree narrows the search to the segments adjacent to the nearest densified vertices; the exact
+    point-to-segment distance is then evaluated for those candidates.
+    """
+    verts, has_next = route_index["verts"], route_index["has_next"]
+    pts = np.column_stack((px, py))
+    k = min(ROUTE_INDEX_NEIGHBORS, len(verts))
+    vert_dist, idx = route_index["tree"].query(pts, k=k)
+    vert_dist = vert_dist.reshape(len(pts), k)
+    idx = idx.reshape(len(pts), k)
+
+    # Candidate segments start at each neighbour vertex and at the vertex before it
+    starts = np.concatenate((idx, idx - 1), axis=1)
+    valid = (starts >= 0) & has_next[np.clip(starts, 0, None)]
+    starts = np.clip(starts, 0, len(verts) - 2) if len(verts) > 1 else np.zeros_like(starts)
+
+    a = verts[starts]
+    b = verts[np.minimum(starts + 1, len(verts) - 1)]
+    ab = b - a
+    ap = pts[:, None, :] - a
+    denom = np.einsum("ijk,ijk->ij", ab, ab)
+    t = np.clip(np.einsum("ijk,ijk->ij", ap, ab) / np.where(denom > 0, denom, 1), 0, 1)
+    seg_dist = np.linalg.norm(ap - t[..., None] * ab, axis=2)
+    seg_dist[~valid] = np.inf
+
+    return np.minimum(seg_dist.min(axis=1), vert_dist.min(axis=1))
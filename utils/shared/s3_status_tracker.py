@@ -46,6 +46,11 @@ def atomic_write_text(path: Path, text: str) -> None:
     tmp.replace(path)
 
 
+def heartbeat_write_text(path: Path, text: str) -> None:
+    """Plain in-place overwrite for advisory heartbeat updates (no temp file + rename)."""
+    path.write_text(text, encoding="utf-8")
+
+
 class StatusTracker:
     """
     Thread-safe, throttled JSON status writer with per-group and global stats.
@@ -74,12 +79,16 @@ class StatusTracker:
         self.status_path = status_path
         self.interval = max(0.2, float(interval_sec))
         self.group_key = group_key
+        self._singular = group_key.rstrip('s')
+        self._current_key = f"current_{self._singular}"
+        self._start_phase = f"{self._singular}_start"
+        self._complete_phase = f"{self._singular}_complete"
         self.lock = threading.Lock()
         self.last_flush = 0.0
         self.data = {
             "started_at": now_ts(),
             "phase": "init",
-            f"current_{group_key.rstrip('s')}": None,
+            self._current_key: None,
             "current_file": None,
             "current_file_bytes": 0,
             "current_file_size": 0,
@@ -97,8 +106,8 @@ class StatusTracker:
     def start_group(self, group: str, planned_files: int):
         """Begin processing a group."""
         with self.lock:
-            self.data["phase"] = f"{self.group_key.rstrip('s')}_start"
-            self.data[f"current_{self.group_key.rstrip('s')}"] = group
+            self.data["phase"] = self._start_phase
+            self.data[self._current_key] = group
             self.data[self.group_key].setdefault(group, {
                 "planned_files": planned_files,
                 "uploaded": 0,
@@ -116,7 +125,7 @@ class StatusTracker:
             g = self.data[self.group_key].get(group)
             if g:
                 g["completed_at"] = now_ts()
-            self.data["phase"] = f"{self.group_key.rstrip('s')}_complete"
+            self.data["phase"] = self._complete_phase
             self.data["current_file"] = None
             self.data["current_file_bytes"] = 0
             self.data["current_file_size"] = 0
@@ -126,7 +135,7 @@ class StatusTracker:
         """Begin uploading a file."""
         with self.lock:
             self.data["phase"] = "uploading"
-            self.data[f"current_{self.group_key.rstrip('s')}"] = group
+            self.data[self._current_key] = group
             self.data["current_file"] = str(fpath)
             self.data["current_file_bytes"] = 0
             self.data["current_file_size"] = int(size)
@@ -207,9 +216,15 @@ class StatusTracker:
             self._flush()
 
     def _flush(self, force: bool = False):
-        """Write JSON status to disk."""
+        """
+        Write JSON status to disk.
+
+        Throttled heartbeat writes overwrite the file in place; forced flushes (group
+        boundaries, shutdown) use an atomic temp-file rename.
+        """
         if not self.status_path:
             return
         self.data["last_update"] = now_ts()
-        atomic_write_text(self.status_path, json.dumps(self.data, ensure_ascii=False, indent=2))
+        write = atomic_write_text if force else heartbeat_write_text
+        write(self.status_path, json.dumps(self.data, ensure_ascii=False, indent=2))
         self.last_flush = now_ts()
@@ -29,8 +29,12 @@ from __future__ import annotations
 
 import csv
 import hashlib
+import mmap
+import multiprocessing as _mp
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Set, Tuple, Optional
+from typing import Dict, Iterable, Set, Tuple, Optional, Union
 
 try:
     import yaml
@@ -43,6 +47,8 @@ try:
 except ImportError:
     raise ImportError("boto3 is required. Install with: pip install boto3")
 
+_CPU_COUNT = _mp.cpu_count()
+
 
 def load_cfg(cfg_path: Path) -> dict:
     """Load and validate YAML configuration file."""
@@ -118,14 +124,13 @@ def resolve_max_concurrency(val) -> int:
     if isinstance(val, int):
         return max(1, val)
 
-    if isinstance(val, str) and val.lower().startswith("cpu*"):
-        try:
-            import multiprocessing as mp
-            ncpu = mp.cpu_count()
-            mult = int(val.split("*", 1)[1])
-            return max(1, ncpu * mult)
-        except (ValueError, IndexError):
-            return 16
+    if isinstance(val, str):
+        s = val.lower()
+        if s.startswith("cpu*"):
+            try:
+                return max(1, _CPU_COUNT * int(s[4:]))
+            except ValueError:
+                return 16
 
     try:
         return max(1, int(val))
@@ -133,40 +138,77 @@ def resolve_max_concurrency(val) -> int:
         return 16
 
 
+@lru_cache(maxsize=1024)
 def normalize_s3_prefix(prefix: str) -> str:
     """
     Normalize S3 prefix to consistent format.
 
-    Removes leading slash, ensures trailing slash.
+    Removes leading slash, ensures trailing slash. Results are memoized since
+    prefixes come from a small set of project/group names.
     Example: "RMI25320/reels" -> "RMI25320/reels/"
     """
     if not prefix:
         return ""
 
     clean = prefix.strip().lstrip("/")
+    return clean if not clean or clean.endswith("/") else clean + "/"
+
 
-    if clean and not clean.endswith("/"):
-        clean += "/"
+# Files above this size are hashed with the chunked read loop to avoid mapping very large address ranges
+MMAP_HASH_MAX_BYTES = 32 * 1024 * 1024 * 1024
+
+
+def _hash_file(h, path: Path, blocksize: int) -> str:
+    """
+    Feed a file into a hashlib object and return the hex digest.
 
-    return clean
+    Memory-maps the file (zero-copy) when it is non-empty and below MMAP_HASH_MAX_BYTES,
+    otherwise falls back to a streaming readinto() loop over a single reusable buffer.
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = path.stat().st_size
+        if 0 < size <= MMAP_HASH_MAX_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if hasattr(m, "madvise"):
+                    m.madvise(mmap.MADV_SEQUENTIAL)
+                h.update(memoryview(m))
+        else:
+            # Reuse one buffer for every read instead of allocating a new bytes object per chunk
+            buf = bytearray(blocksize)
+            mv = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(mv[:n])
+    return h.hexdigest()
 
 
 def md5_file(path: Path, blocksize: int = 8 * 1024 * 1024) -> str:
     """Fast streaming MD5 for small files (used when object is < multipart_threshold)."""
-    h = hashlib.md5()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(blocksize), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return _hash_file(hashlib.md5(), Path(path), blocksize)
 
 
 def sha256_file(path: Path, blocksize: int = 8 * 1024 * 1024) -> str:
     """Streaming SHA-256 for large files (more reliable than size-only)."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(blocksize), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return _hash_file(hashlib.sha256(), Path(path), blocksize)
+
+
+def batch_head_objects(s3, bucket: str, keys: Iterable[str],
+                       max_workers: int = 32) -> Dict[str, Union[dict, Exception]]:
+    """
+    Issue HEAD requests for many keys concurrently.
+
+    The boto3 client is shared across worker threads (clients are thread-safe).
+
+    Returns:
+        Mapping of key -> head_object response, or the exception raised for that key
+    """
+    def _head(k: str):
+        try:
+            return k, s3.head_object(Bucket=bucket, Key=k)
+        except Exception as e:
+            return k, e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return dict(ex.map(_head, keys))
 
 
 def s3_object_matches_local(
@@ -176,11 +218,15 @@ def s3_object_matches_local(
     fpath: Path,
     multipart_threshold_bytes: int,
     skip_large_check: bool = False,
-    verify_large: bool = False
+    verify_large: bool = False,
+    head: Optional[Union[dict, Exception]] = None
 ) -> Tuple[bool, str]:
     """
     Check if S3 already has an identical object.
 
+    If ``head`` is supplied (e.g. prefetched with batch_head_objects), it is used
+    instead of issuing a new HEAD request.
+
     Returns:
         (match, reason) tuple
         - match: True if file should be skipped (already uploaded)
@@ -190,15 +236,19 @@ def s3_object_matches_local(
     - Small files (<threshold): MD5 comparison with ETag
     - Large files (≥threshold): SHA-256 (if available) > timestamp heuristics > size-only
     """
-    try:
-        head = s3.head_object(Bucket=bucket, Key=key)
-    except ClientError as e:
-        code = e.response.get("Error", {}).get("Code")
+    if head is None:
+        try:
+            head = s3.head_object(Bucket=bucket, Key=key)
+        except Exception as e:
+            head = e
+
+    if isinstance(head, ClientError):
+        code = head.response.get("Error", {}).get("Code")
         if code in ("404", "NoSuchKey", "NotFound"):
             return (False, "not_found")
         return (False, f"head_error:{code or 'unknown'}")
-    except Exception as e:
-        return (False, f"head_exception:{type(e).__name__}")
+    if isinstance(head, Exception):
+        return (False, f"head_exception:{type(head).__name__}")
 
     remote_size = head.get("ContentLength")
     local_size = fpath.stat().st_size
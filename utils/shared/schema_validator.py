@@ -16,7 +16,7 @@
 #
 # File Location:        /utils/shared/schema_validator.py
 # Called By:            create_oid_feature_class.py, orchestrator, config_loader
-# Int. Dependencies:    utils/manager/config_manager, utils/shared/expression_utils, utils/shared/exceptions, utils/shared/build_oid_schema
+# Int. Dependencies:    utils/manager/config_manager, utils/shared/arcpy_utils, utils/shared/expression_utils, utils/shared/exceptions, utils/shared/build_oid_schema
 # Ext. Dependencies:    arcpy, typing
 #
 # Documentation:
@@ -28,29 +28,56 @@
 # =============================================================================
 
 import arcpy
-from typing import Set
+from typing import Dict, Set, Tuple
 
+from utils.shared.arcpy_utils import workspace_stamp
 from utils.shared.expression_utils import load_field_registry
 from utils.build_oid_schema import create_oid_schema_template
 from utils.shared.rmi_exceptions import ConfigValidationError
 from utils.manager.config_manager import ConfigManager
 
+# Template field names keyed by template path -> (workspace modification stamp, field names)
+_TEMPLATE_FIELDS_CACHE: Dict[str, Tuple[float, Set[str]]] = {}
+
+
+def _template_field_names(template_fc) -> Set[str]:
+    """
+    Returns the field names of the template, reusing the previous lookup while its workspace is unchanged.
+    """
+    key = str(template_fc)
+    stamp = workspace_stamp(template_fc)
+    cached = _TEMPLATE_FIELDS_CACHE.get(key)
+    if stamp is not None and cached and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        names = {f.name for f in arcpy.da.Describe(template_fc)["fields"]}
+    except AttributeError:
+        # Older ArcGIS Pro releases without arcpy.da.Describe
+        names = {f.name for f in arcpy.ListFields(template_fc)}
+
+    if stamp is not None:
+        _TEMPLATE_FIELDS_CACHE[key] = (stamp, names)
+    return names
+
 
 def _extract_required_field_names(cfg: 'ConfigManager', registry: dict) -> Set[str]:
     """
     Helper to extract required field names from config and registry.
     """
-    required_names = set()
-    not_applicable_enabled = cfg.get("oid_schema_template.esri_default.not_applicable", False)
-    for _key, field in registry.items():
-        cat = field.get("category")
-        if cat == "standard" or (cat == "not_applicable" and not_applicable_enabled):
-            required_names.add(field["name"])
-    for section in ["mosaic_fields", "grp_idx_fields", "linear_ref_fields", "custom_fields"]:
-        fields = cfg.get(f"oid_schema_template.{section}", {})
-        for f in fields.values():
-            required_names.add(f["name"])
-    return required_names
+    template = cfg.get("oid_schema_template", {}) or {}
+    not_applicable_enabled = (template.get("esri_default") or {}).get("not_applicable", False)
+    registry_names = {
+        field["name"] for field in registry.values()
+        if field.get("category") == "standard"
+        or (field.get("category") == "not_applicable" and not_applicable_enabled)
+    }
+    section_names = {
+        f["name"]
+        for section in ("mosaic_fields", "grp_idx_fields", "linear_ref_fields", "custom_fields")
+        for f in (template.get(section) or {}).values()
+    }
+    return registry_names | section_names
 
 def validate_oid_template_schema(cfg: 'ConfigManager') -> bool:
     """
@@ -70,12 +97,13 @@ def validate_oid_template_schema(cfg: 'ConfigManager') -> bool:
         logger.warning(f"OID schema template not found at: {template_fc}")
         return False
 
-    existing_fields = {f.name for f in arcpy.ListFields(template_fc)}
+    existing_fields = _template_field_names(template_fc)
     registry = load_field_registry(cfg=cfg)
     required_names = _extract_required_field_names(cfg, registry)
 
-    missing = required_names - existing_fields
-    if missing:
+    # Fast path: stop at the first missing name; only build the full difference when reporting
+    if any(name not in existing_fields for name in required_names):
+        missing = required_names - existing_fields
         logger.warning(f"OID template is missing {len(missing)} required field(s): {sorted(missing)}")
         return False
 
@@ -16,8 +16,8 @@
 # File Location:        /utils/smooth_gps_noise.py
 # Validator:            /utils/validators/smooth_gps_noise_validator.py
 # Called By:            tools/smooth_gps_noise_tool.py, orchestrator
-# Int. Dependencies:    utils/manager/config_manager
-# Ext. Dependencies:    arcpy, csv, math, typing
+# Int. Dependencies:    utils/manager/config_manager, utils/shared/geo_utils, utils/shared/route_index
+# Ext. Dependencies:    arcpy, csv, numpy, os, typing
 #
 # Documentation:
 #   See: docs_legacy/TOOL_GUIDES.md and docs_legacy/tools/smooth_gps_noise.md
@@ -31,97 +31,170 @@ __all__ = ["smooth_gps_noise"]
 
 import arcpy
 import csv
+import os
+import numpy as np
 from typing import Optional, Dict, List
-from math import radians, sin, cos, sqrt, atan2, degrees
 
 from utils.manager.config_manager import ConfigManager
+from utils.shared.geo_utils import haversine_np
+from utils.shared.route_index import build_route_index, route_distances
 
+# Shared WGS84 spatial reference for projecting OID points (constructed once at import)
+try:
+    _WGS84 = arcpy.SpatialReference(4326)
+except Exception:
+    _WGS84 = None
 
-def haversine(x1, y1, x2, y2):
+# Outlier reasons in bit order of the per-point reason mask, and a popcount lookup for 4-bit masks
+REASON_NAMES = ("Deviation", "Angle", "Step", "RouteDev")
+REASON_POPCOUNT = np.array([bin(i).count("1") for i in range(1 << len(REASON_NAMES))], dtype=np.uint8)
+
+# Maximum number of OIDs per "IN (...)" where clause when writing QCFlag
+QCFLAG_WHERE_CHUNK = 1000
+
+# Debug CSV columns, in the order rows are built in smooth_gps_noise
+CSV_FIELDS = ("OID", "Deviation", "Angle", "Step", "RouteDist", "RouteDistDev",
+              *(f"Reason_{name}" for name in REASON_NAMES),
+              "Reason_Count", "Is_Outlier", "QCReason")
+
+
+def compute_gps_metrics(x: np.ndarray, y: np.ndarray, window: int):
     """
-    Calculates the great-circle distance in meters between two latitude/longitude points.
-    
+    Computes per-point deviation, angle and step metrics for one reel in a single vectorized kernel.
+
+    Deviation is the distance from each point to the midpoint of its neighbours ``window`` positions away,
+    angle is the turn angle in degrees between the directions to those two neighbours, and step is the distance
+    from the previous point. Points without neighbours on both sides keep deviation 0 and angle 180.
+
     Args:
-        x1: Longitude of the first point in decimal degrees.
-        y1: Latitude of the first point in decimal degrees.
-        x2: Longitude of the second point in decimal degrees.
-        y2: Latitude of the second point in decimal degrees.
-    
+        x: Longitudes in decimal degrees, sorted by acquisition time.
+        y: Latitudes in decimal degrees, sorted by acquisition time.
+        window: Neighbour offset used for deviation and angle.
+
+    Returns:
+        Tuple of (deviation, angle, step) arrays.
+    """
+    n = len(x)
+    deviations = np.zeros(n)
+    angles = np.full(n, 180.0)
+    steps = np.zeros(n)
+
+    if n > 1:
+        steps[1:] = haversine_np(x[:-1], y[:-1], x[1:], y[1:])
+
+    if n > 2 * window:
+        inner = slice(window, n - window)
+        prev = slice(0, n - 2 * window)
+        nxt = slice(2 * window, n)
+        deviations[inner] = haversine_np(x[inner], y[inner], (x[prev] + x[nxt]) / 2, (y[prev] + y[nxt]) / 2)
+
+        angle1 = np.arctan2(y[prev] - y[inner], x[prev] - x[inner])
+        angle2 = np.arctan2(y[nxt] - y[inner], x[nxt] - x[inner])
+        angles[inner] = np.abs(np.degrees(angle2 - angle1)) % 360
+
+    return deviations, angles, steps
+
+
+def project_points(x: np.ndarray, y: np.ndarray, route_sr, logger, reel: str):
+    """
+    Projects WGS84 lon/lat arrays into the route spatial reference with a single multipoint projection.
+
     Returns:
-        The distance between the two points in meters.
+        Tuple of projected (x, y) arrays, or (None, None) if the projection fails.
     """
-    r = 6371000  # Earth radius in meters
-    phi1, phi2 = radians(y1), radians(y2)
-    d_phi = radians(y2 - y1)
-    d_lambda = radians(x2 - x1)
-    a = sin(d_phi / 2) ** 2 + cos(phi1) * cos(phi2) * sin(d_lambda / 2) ** 2
-    return r * 2 * atan2(sqrt(a), sqrt(1 - a))
+    try:
+        wgs84 = _WGS84 or arcpy.SpatialReference(4326)
+        mp = arcpy.Multipoint(arcpy.Array([arcpy.Point(px, py) for px, py in zip(x, y)]), wgs84)
+        projected = mp.projectAs(route_sr)
+        part = projected.getPart()
+        proj_x = np.array([pt.X for pt in part], dtype=np.float64)
+        proj_y = np.array([pt.Y for pt in part], dtype=np.float64)
+    except Exception as e:
+        logger.warning(f"Projection failed for reel {reel}: {e}")
+        return None, None
+
+    if len(proj_x) != len(x):
+        logger.warning(f"Projection for reel {reel} returned {len(proj_x)} of {len(x)} points; "
+                       f"skipping route distance checks.")
+        return None, None
+    return proj_x, proj_y
+
+
+def near_table_distances(px: np.ndarray, py: np.ndarray, centerline_fc: str, route_sr, logger,
+                         reel: str) -> Optional[np.ndarray]:
+    """
+    Computes the distance from each projected point to the nearest centerline with one GenerateNearTable call.
 
+    The points are written to a temporary in-memory feature class; each near-table row is mapped back to its
+    input point through the OIDs returned by the insert cursor. Scratch names are unique per call, so concurrent
+    callers in the same session never delete each other's data.
 
-def angle_between(p1, p2, p3):
-    """Calculate the angle at p2 formed by three points."""
-    dx1, dy1 = p1[0] - p2[0], p1[1] - p2[1]
-    dx2, dy2 = p3[0] - p2[0], p3[1] - p2[1]
-    angle1 = atan2(dy1, dx1)
-    angle2 = atan2(dy2, dx2)
-    return abs(degrees(angle2 - angle1)) % 360
+    Returns:
+        Array of distances in route units, or None if the near table could not be generated.
+    """
+    pts_fc = arcpy.CreateUniqueName("gps_route_pts", "memory")
+    near_table = arcpy.CreateUniqueName("gps_route_near", "memory")
+    try:
+        arcpy.management.CreateFeatureclass("memory", os.path.basename(pts_fc), "POINT", spatial_reference=route_sr)
+        with arcpy.da.InsertCursor(pts_fc, ["SHAPE@XY"]) as cursor:
+            inserted = np.array([cursor.insertRow(((cx, cy),)) for cx, cy in zip(px, py)], dtype=np.int64)
+
+        arcpy.analysis.GenerateNearTable(pts_fc, centerline_fc, near_table, closest="CLOSEST")
+        near = arcpy.da.TableToNumPyArray(near_table, ["IN_FID", "NEAR_DIST"])
+
+        dist = np.zeros(len(px))
+        order = np.argsort(inserted)
+        dist[order[np.searchsorted(inserted[order], near["IN_FID"])]] = near["NEAR_DIST"]
+        return dist
+    except Exception as e:
+        logger.warning(f"Near table failed for reel {reel}: {e}")
+        return None
+    finally:
+        for item in (pts_fc, near_table):
+            if arcpy.Exists(item):
+                arcpy.management.Delete(item)
 
 
 def process_gps_metrics(
-        points: List[dict],
+        points: Dict[str, np.ndarray],
         cfg: ConfigManager,
-        routes,
+        centerline_fc,
         route_sr,
         reel: str,
         global_counter: List[int],
         total: int,
         logger,
-        progressor=None):
-
-    window = cfg.get("gps_smoothing.smoothing_window")
-
-    for i in range(len(points)):
-        p = points[i]
-        prev_pt = points[i - window] if i >= window else None
-        next_pt = points[i + window] if i + window < len(points) else None
-
-        if prev_pt and next_pt:
-            mid_x = (prev_pt["x"] + next_pt["x"]) / 2
-            mid_y = (prev_pt["y"] + next_pt["y"]) / 2
-            p["deviation"] = haversine(p["x"], p["y"], mid_x, mid_y)
-            p["angle"] = angle_between((prev_pt["x"], prev_pt["y"]),
-                                       (p["x"], p["y"]),
-                                       (next_pt["x"], next_pt["y"]))
-        else:
-            p["deviation"] = 0
-            p["angle"] = 180
-
-        p["step"] = haversine(points[i - 1]["x"], points[i - 1]["y"], p["x"], p["y"]) if i > 0 else 0
-        p["route_dist"] = 0
-
-        if route_sr:
-            try:
-                pt_geom = arcpy.PointGeometry(arcpy.Point(p["x"], p["y"]), arcpy.SpatialReference(4326))
-                pt_proj = pt_geom.projectAs(route_sr)
-                min_dist = float("inf")
-                for route in routes:
-                    dist = route.queryPointAndDistance(pt_proj.centroid, use_percentage=False)[2]
-                    min_dist = min(min_dist, dist)
-                p["route_dist"] = min_dist
-            except Exception as e:
-                logger.warning(f"Projection failed for OID {p['oid']}: {e}")
-                p["route_dist"] = 0
-
-        global_counter[0] += 1
-        progressor.update(global_counter[0])
-
-    # Route distance smoothing
-    for i in range(1, len(points) - 1):
-        prev, curr, nxt = points[i - 1], points[i], points[i + 1]
-        avg = (prev["route_dist"] + nxt["route_dist"]) / 2
-        curr["route_dev"] = abs(curr["route_dist"] - avg)
-        global_counter[0] += 1
-        progressor.update(global_counter[0])
+        progressor=None,
+        route_index=None):
+
+    x, y = points["x"], points["y"]
+    n = len(x)
+
+    route_dist = np.zeros(n)
+    proj_x = proj_y = None
+
+    if route_sr and n:
+        proj_x, proj_y = project_points(x, y, route_sr, logger, reel)
+
+    # Nearest centerline distance for all points in one batched query: KD-tree when an index is available,
+    # otherwise a single near table for the reel
+    if proj_x is not None and route_index is not None:
+        route_dist = route_distances(route_index, proj_x, proj_y)
+    elif proj_x is not None and centerline_fc:
+        near_dist = near_table_distances(proj_x, proj_y, centerline_fc, route_sr, logger, reel)
+        if near_dist is not None:
+            route_dist = near_dist
+
+    global_counter[0] += n
+    progressor.update(global_counter[0])
+
+    # Route distance smoothing: deviation of each interior point from the mean of its neighbours
+    route_dev = np.zeros(n)
+    if n > 2:
+        route_dev[1:-1] = np.abs(route_dist[1:-1] - (route_dist[:-2] + route_dist[2:]) / 2)
+
+    points["route_dist"] = route_dist
+    points["route_dev"] = route_dev
 
 
 def smooth_gps_noise(cfg: ConfigManager, oid_fc: str, centerline_fc: Optional[str] = None) -> None:
@@ -151,25 +224,25 @@ def smooth_gps_noise(cfg: ConfigManager, oid_fc: str, centerline_fc: Optional[st
 
     log_csv_path = cfg.paths.get_log_file_path("gps_smooth_debug", cfg)
 
-    # Extract points by Reel
-    points_by_reel: Dict[str, List[dict]] = {}
-    with arcpy.da.SearchCursor(oid_fc, ["OID@", "SHAPE@", "AcquisitionDate", "Reel"]) as cursor:
-        for oid, shape, ts, reel in cursor:
-            if not reel:
-                reel = "__UNREEL__"
-            pt = shape.centroid
-            points_by_reel.setdefault(reel, []).append({
-                "oid": oid,
-                "x": pt.X,
-                "y": pt.Y,
-                "z": pt.Z if pt.Z is not None else 0,
-                "shape": pt,
-                "ts": ts,
-                "reel": reel
-            })
-
-    for pts in points_by_reel.values():
-        pts.sort(key=lambda p: p["ts"])
+    # Extract points by Reel in a single read into a structured array
+    arr = arcpy.da.FeatureClassToNumPyArray(
+        oid_fc, ["OID@", "SHAPE@X", "SHAPE@Y", "SHAPE@Z", "AcquisitionDate", "Reel"],
+        null_value={"Reel": "", "SHAPE@Z": 0})
+
+    # Group by reel (in order of first appearance), sort each reel by acquisition time and store it as
+    # parallel (SoA) arrays
+    unique_reels, first_idx, reel_idx = np.unique(arr["Reel"], return_index=True, return_inverse=True)
+    points_by_reel: Dict[str, Dict[str, np.ndarray]] = {}
+    for r in np.argsort(first_idx):
+        members = np.flatnonzero(reel_idx.ravel() == r)
+        members = members[np.argsort(arr["AcquisitionDate"][members], kind="stable")]
+        reel = str(unique_reels[r]) or "__UNREEL__"
+        points_by_reel[reel] = {
+            "oid": arr["OID@"][members].astype(np.int64),
+            "x": arr["SHAPE@X"][members].astype(np.float64),
+            "y": arr["SHAPE@Y"][members].astype(np.float64),
+            "z": np.nan_to_num(arr["SHAPE@Z"][members].astype(np.float64)),
+        }
 
     # Load centerline routes
     routes = []
@@ -180,77 +253,83 @@ def smooth_gps_noise(cfg: ConfigManager, oid_fc: str, centerline_fc: Optional[st
                 routes.append(row[0])
         if routes:
             route_sr = routes[0].spatialReference
+    route_index = build_route_index(routes, route_sr, logger) if route_sr else None
 
     # Count total for progress tracking
-    total_points = sum(len(v) for v in points_by_reel.values()) * 2
+    point_count = sum(len(v["oid"]) for v in points_by_reel.values())
+    total_points = point_count * 2
     global_counter = [0]
 
     # Create a single progressor for all reels
     with cfg.get_progressor(total=total_points, label="Smoothing GPS") as progressor:
-        for reel, pts in points_by_reel.items():
-            process_gps_metrics(pts, cfg, routes, route_sr, reel, global_counter, total_points, logger, progressor)
+        window = cfg.get("gps_smoothing.smoothing_window")
+        for pts in points_by_reel.values():
+            pts["deviation"], pts["angle"], pts["step"] = compute_gps_metrics(pts["x"], pts["y"], window)
+            global_counter[0] += len(pts["oid"])
+            progressor.update(global_counter[0])
 
+        for reel, pts in points_by_reel.items():
+            process_gps_metrics(pts, cfg, centerline_fc, route_sr, reel, global_counter, total_points, logger, progressor,
+                                route_index=route_index)
 
-    # Flag outliers
-    outlier_oids = set()
+    # Concatenate per-reel columns (reel order preserved) for flagging
+    metric_keys = ("oid", "deviation", "angle", "step", "route_dist", "route_dev")
+    if points_by_reel:
+        all_pts = {k: np.concatenate([pts[k] for pts in points_by_reel.values()]) for k in metric_keys}
+    else:
+        all_pts = {k: np.empty(0) for k in metric_keys}
+
+    # Flag outliers: each reason is one bit of a per-point mask (bit order follows REASON_NAMES)
+    deviation, angle, step = all_pts["deviation"], all_pts["angle"], all_pts["step"]
+    angle_lo, angle_hi = angle_bounds[0], angle_bounds[1]
+    step_lo, step_hi = spacing - proximity_range, spacing + proximity_range
+    reason_bits = (
+        deviation > deviation_thresh,
+        (angle < angle_lo) | (angle > angle_hi),
+        (step < step_lo) | (step > step_hi),
+        all_pts["route_dev"] > max_route_dev,
+    )
+    reason_mask = np.zeros(point_count, dtype=np.uint8)
+    for bit, flagged in enumerate(reason_bits):
+        reason_mask |= flagged.astype(np.uint8) << bit
+
+    # Initial exclusion: first point can never be flagged
+    reason_mask[:1] = 0
+    reason_count = REASON_POPCOUNT[reason_mask]
+    is_outlier = reason_count >= outlier_threshold
+    is_outlier[:1] = False
+
+    # Propagate flags for sequences (surrounded by outliers). A flipped point's neighbours are already
+    # outliers, so a single shifted-array pass matches the sequential scan.
+    if point_count > 2:
+        is_outlier[1:-1] |= is_outlier[:-2] & is_outlier[2:]
+
+    # Append to CSV only if at least one reason is True
     csv_rows = []
-    all_pts = [p for sub in points_by_reel.values() for p in sub]
-
-
-    for i, p in enumerate(all_pts):
-        # Initial exclusion: first point can never be flagged
-        if i == 0:
-            p["is_outlier"] = False
-        else:
-            reasons = {
-                "Deviation": p["deviation"] > deviation_thresh,
-                "Angle": not (angle_bounds[0] <= p["angle"] <= angle_bounds[1]),
-                "Step": p["step"] < spacing - proximity_range or p["step"] > spacing + proximity_range,
-                "RouteDev": p.get("route_dev", 0) > max_route_dev
-            }
-            count = sum(reasons.values())
-            p["is_outlier"] = count >= outlier_threshold
-            p["Reason_Count"] = count
-            p.update({f"Reason_{k}": v for k, v in reasons.items()})
-
-        if p["is_outlier"]:
-            outlier_oids.add(p["oid"])
-
-        # Append to CSV only if at least one reason is True
-        if p.get("Reason_Count", 0):
-            reasons_str = [k for k in ["Deviation", "Angle", "Step", "RouteDev"] if p.get(f"Reason_{k}")]
-            csv_rows.append({
-                "OID": p["oid"],
-                "Deviation": round(p["deviation"], 3),
-                "Angle": round(p["angle"], 2),
-                "Step": round(p["step"], 3),
-                "RouteDist": round(p["route_dist"], 3),
-                "RouteDistDev": round(p.get("route_dev", 0), 3),
-                "Reason_Deviation": p.get("Reason_Deviation", False),
-                "Reason_Angle": p.get("Reason_Angle", False),
-                "Reason_Step": p.get("Reason_Step", False),
-                "Reason_RouteDev": p.get("Reason_RouteDev", False),
-                "Reason_Count": p.get("Reason_Count", 0),
-                "Is_Outlier": p["is_outlier"],
-                "QCReason": ", ".join(reasons_str)
-            })
-
-    # Propagate flags for sequences (surrounded by outliers)
-    for i in range(1, len(all_pts) - 1):
-        if not all_pts[i]["is_outlier"] and all_pts[i - 1]["is_outlier"] and all_pts[i + 1]["is_outlier"]:
-            all_pts[i]["is_outlier"] = True
-            outlier_oids.add(all_pts[i]["oid"])
-            for row in csv_rows:
-                if row["OID"] == all_pts[i]["oid"]:
-                    row["Is_Outlier"] = True
-                    break
+    for i in np.flatnonzero(reason_count):
+        mask = int(reason_mask[i])
+        flags = [bool(mask >> bit & 1) for bit in range(len(REASON_NAMES))]
+        csv_rows.append((
+            int(all_pts["oid"][i]),
+            round(float(deviation[i]), 3),
+            round(float(angle[i]), 2),
+            round(float(step[i]), 3),
+            round(float(all_pts["route_dist"][i]), 3),
+            round(float(all_pts["route_dev"][i]), 3),
+            *flags,
+            int(reason_count[i]),
+            bool(is_outlier[i]),
+            ", ".join(name for name, flag in zip(REASON_NAMES, flags) if flag)
+        ))
+
+    outlier_oids = {int(oid) for oid in all_pts["oid"][is_outlier]}
 
     # Write CSV debug log
     if csv_rows:
         try:
-            with open(log_csv_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=csv_rows[0].keys())
-                writer.writeheader()
+            with open(log_csv_path, "w", newline="", buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
                 writer.writerows(csv_rows)
             logger.info(f"📄 Debug CSV written to: {log_csv_path}", indent=1)
         except Exception as e:
@@ -262,10 +341,15 @@ def smooth_gps_noise(cfg: ConfigManager, oid_fc: str, centerline_fc: Optional[st
         arcpy.management.AddField(oid_fc, "QCFlag", "TEXT", field_length=50)
 
     if outlier_oids:
+        # Only materialize flagged rows; OID lists are chunked to stay under SQL IN-list limits
+        oid_field = arcpy.Describe(oid_fc).OIDFieldName
+        sorted_oids = sorted(outlier_oids)
         with cfg.get_progressor(total=len(outlier_oids), label="Updating QCFlag") as update_prog:
-            with arcpy.da.UpdateCursor(oid_fc, ["OID@", "QCFlag"]) as cursor:
-                for oid, flag in cursor:
-                    if oid in outlier_oids:
+            for start in range(0, len(sorted_oids), QCFLAG_WHERE_CHUNK):
+                oids_str = ",".join(map(str, sorted_oids[start:start + QCFLAG_WHERE_CHUNK]))
+                where_clause = f"{oid_field} IN ({oids_str})"
+                with arcpy.da.UpdateCursor(oid_fc, ["OID@", "QCFlag"], where_clause) as cursor:
+                    for oid, flag in cursor:
                         cursor.updateRow((oid, "GPS_OUTLIER"))
                         update_prog.update(1)
     else:
@@ -273,5 +357,5 @@ def smooth_gps_noise(cfg: ConfigManager, oid_fc: str, centerline_fc: Optional[st
 
     logger.success(f"Detected and flagged {len(outlier_oids)} GPS outlier(s).", indent=1)
     logger.info(
-        f"Processed {sum(len(v) for v in points_by_reel.values())} GPS points across {len(points_by_reel)} reel(s).", indent=1)
+        f"Processed {point_count} GPS points across {len(points_by_reel)} reel(s).", indent=1)
 
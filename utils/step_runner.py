@@ -9,15 +9,15 @@
 # Last Updated:        2025-05-20
 #
 # Description:
-#   Iterates through workflow step functions, checking for skip conditions, handling wait intervals,
-#   and optionally backing up the OID feature class between steps. Tracks progress, captures run timing,
-#   appends results to a shared report object, and saves state to JSON after each step. Designed for use
-#   by the orchestrator tool and developer automation.
+#   Schedules workflow step functions by their declared dependencies, optionally running independent arcpy-free
+#   steps on worker threads, checking for skip conditions, handling wait intervals, and optionally backing up the
+#   OID feature class between steps. Tracks progress, captures run timing, appends results to a shared report
+#   object, and periodically saves state to JSON. Designed for use by the orchestrator tool and developer automation.
 #
 # File Location:        /utils/step_runner.py
 # Called By:            tools/process_360_orchestrator.py
 # Int. Dependencies:    utils/shared/arcpy_utils, utils/shared/report_data_builder, utils/manager/config_manager
-# Ext. Dependencies:    time, datetime, typing, traceback
+# Ext. Dependencies:    copy, heapq, time, concurrent.futures, datetime, typing, traceback
 #
 # Documentation:
 #   See: docs_legacy/TOOL_GUIDES.md and docs_legacy/tools/process_360_orchestrator.md
@@ -27,16 +27,24 @@
 #   - Stops execution on first failure by default (can be customized)
 # =============================================================================
 
+import copy
+import heapq
 import time
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from utils.shared.arcpy_utils import backup_oid
 from utils.shared.report_data_builder import save_report_json
 from utils.manager.config_manager import ConfigManager
 
 
+def _utc_iso(dt: datetime) -> str:
+    """Formats a UTC datetime as YYYY-MM-DDTHH:MM:SSZ without going through strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+
+
 def run_steps(
     step_funcs: Dict[str, Dict[str, Any]],
     step_order: List[str],
@@ -49,14 +57,21 @@ def run_steps(
     """
     Executes a sequence of pipeline steps with logging, optional waiting, and OID backups.
 
-    Iterates through the specified steps in order, starting from the given index. For each step, checks if it should be
-    skipped, optionally performs an OID backup and/or waits before execution, and logs the step's status and timing.
-    Updates the report data after each step and saves it to JSON. Stops execution if a step fails.
+    Runs the steps from the given index onward as a dependency graph: each step starts once every step listed in its
+    `depends_on` has finished. Steps that do not declare `depends_on` follow the previous step in step_order. Among
+    the steps that are ready, the one earliest in step_order runs first, so sequential runs follow step_order exactly.
+    Steps run one at a time on the calling thread by default; when `orchestrator.max_parallel` is above 1, steps
+    marked `uses_arcpy: False` run on worker threads alongside them, since arcpy is not thread-safe. With
+    `orchestrator.resume_completed` set, steps already recorded as successful in report_data are skipped, except the
+    start step itself. For each step, checks if it should be skipped, optionally performs an OID backup and/or waits
+    before execution, and logs the step's status and timing. Updates the report data after each step and saves it to
+    JSON at most once per `orchestrator.report_save_interval_sec` (always on failure and when the run ends). Stops
+    scheduling new steps if a step fails.
 
     Args:
         step_funcs: Mapping of step keys to dictionaries containing step metadata, including the function to execute
-        and optional skip logic.
-        step_order: Ordered list of step keys defining execution sequence.
+        and optional skip logic, `depends_on` step keys, and a `uses_arcpy` flag (default True).
+        step_order: Ordered list of step keys defining execution sequence (and default dependencies).
         start_index: Index in step_order to begin execution.
         param_values: Dictionary of parameters, including ArcPy parameters.
         report_data: Dictionary representing the report, updated incrementally with step results.
@@ -75,8 +90,22 @@ def run_steps(
 
     def append_step_result(report: Dict[str, Any], result: Dict[str, Any]) -> None:
         ensure_report_steps(report)
+        if result.get("resumed"):
+            # A resumed step keeps its entry from the previous run; it is only marked, so the report has one row per step
+            for entry in reversed(report["steps"]):
+                if isinstance(entry, dict) and entry.get("name") == result["name"] and entry.get("status") == "✅":
+                    entry["resumed"] = "true"
+                    return
         report["steps"].append(result)
 
+    def merge_step_report(report: Dict[str, Any], step_report: Dict[str, Any]) -> None:
+        # Folds what a worker-thread step wrote into its own report dict back into the shared report
+        for key, value in step_report.items():
+            if isinstance(value, dict) and isinstance(report.get(key), dict):
+                report[key].update(value)
+            else:
+                report[key] = value
+
     def should_skip_step(stp: Dict[str, Any], params: Dict[str, Any]) -> Optional[str]:
         skip_fn = stp.get("skip")
         if skip_fn:
@@ -87,27 +116,39 @@ def run_steps(
                 return None
         return None
 
-    def perform_oid_backup(stp_key: str, params: Dict[str, Any], config: ConfigManager, wait_cfg: Optional[dict]) -> bool:
-        if wait_cfg and wait_cfg.get("backup_oid_between_steps", False):
-            backup_steps = wait_cfg.get("backup_before_step", [])
-            if stp_key in backup_steps:
-                if "oid_fc" not in params:
-                    logger.warning("`oid_fc` not supplied skipping OID backup", indent=1)
-                else:
-                    try:
-                        backup_oid(params["oid_fc"], stp_key, config)
-                        return True
-                    except Exception as e:
-                        logger.warning(f"Failed to back up OID before step '{stp_key}': {e}", indent=1)
+    # Resolve the backup and wait plans once; per-step checks are then set lookups
+    wait_cfg = wait_config or {}
+    backup_keys = frozenset(wait_cfg.get("backup_before_step", []) or []) \
+        if wait_cfg.get("backup_oid_between_steps", False) else frozenset()
+    wait_keys = frozenset(wait_cfg.get("wait_before_step", []) or []) \
+        if wait_cfg.get("wait_between_steps", False) else frozenset()
+    wait_seconds = wait_cfg.get("wait_duration_sec", 60)
+
+    def perform_oid_backup(stp_key: str, params: Dict[str, Any], config: ConfigManager) -> bool:
+        if stp_key in backup_keys:
+            if "oid_fc" not in params:
+                logger.warning("`oid_fc` not supplied skipping OID backup", indent=1)
+            else:
+                try:
+                    backup_oid(params["oid_fc"], stp_key, config)
+                    return True
+                except Exception as e:
+                    logger.warning(f"Failed to back up OID before step '{stp_key}': {e}", indent=1)
         return False
 
-    def perform_wait(stp_key: str, lbl: str, wait_cfg: Optional[dict]):
-        if wait_cfg and wait_cfg.get("wait_between_steps", False):
-            wait_steps = wait_cfg.get("wait_before_step", [])
-            wait_seconds = wait_cfg.get("wait_duration_sec", 60)
-            if stp_key in wait_steps:
-                logger.custom(f"Waiting {wait_seconds} seconds before running step: {lbl}", indent=0, emoji="⏳")
-                time.sleep(wait_seconds)
+    def perform_wait(stp_key: str, lbl: str):
+        if stp_key in wait_keys:
+            logger.custom(f"Waiting {wait_seconds} seconds before running step: {lbl}", indent=0, emoji="⏳")
+            # Let any in-flight report save finish during the wait rather than in addition to it
+            wait_start = time.monotonic()
+            if pending_save is not None:
+                try:
+                    pending_save.result(timeout=wait_seconds)
+                except Exception:
+                    pass
+            remaining = wait_seconds - (time.monotonic() - wait_start)
+            if remaining > 0:
+                time.sleep(remaining)
 
     def perform_cache_clearing(stp_key: str, oid_fc: Optional[str]):
         """Clear ArcGIS caches after steps that modify feature classes to prevent stale data issues"""
@@ -134,6 +175,7 @@ def run_steps(
 
     def execute_step(lbl: str, function, rpt_data: Dict[str, Any], step_key=None):
         stp_start = datetime.now(timezone.utc)
+        t0 = time.monotonic_ns()
         try:
             with logger.step(lbl, context={"step_key": step_key} if step_key else None):
                 function(report_data=rpt_data)
@@ -141,21 +183,52 @@ def run_steps(
             note = "Success"
         except Exception as e:
             stts = "❌"
-            tb = traceback.format_exc()
-            note = f"{e}\n{tb}"
-        stp_end = datetime.now(timezone.utc)
-        elpsd = f"{(stp_end - stp_start).total_seconds():.1f} sec"
+            # Keep the report note to the exception line; the full traceback is only formatted for debug logging
+            note = "".join(traceback.format_exception_only(type(e), e)).strip()
+            if cfg.get("debug_messages", False):
+                logger.debug(f"{lbl} failed:\n{traceback.format_exc()}", indent=1)
+        # Elapsed time comes from the monotonic clock (immune to wall-clock jumps); the end stamp is derived from it
+        elapsed_ns = time.monotonic_ns() - t0
+        stp_end = stp_start + timedelta(microseconds=elapsed_ns // 1000)
+        elpsd = f"{elapsed_ns / 1e9:.1f} sec"
         return stts, note, stp_start, stp_end, elpsd
 
-    for step_key in step_order[start_index:]:
-        if step_key not in step_funcs:
-            logger.error(f"Step '{step_key}' not found in step_funcs dictionary", error_type=KeyError, indent=0)
-            break
+    save_interval = float(cfg.get("orchestrator.report_save_interval_sec", 5) or 0)
+    last_save = 0.0
+    # Report saves run in order on a single background writer so steps (and waits) do not block on disk I/O.
+    # The writer only ever sees deep copies: report_data is changed by the steps running on the calling thread,
+    # so each save serializes a snapshot taken there between steps.
+    save_executor = ThreadPoolExecutor(max_workers=1)
+    pending_save: Optional[Future] = None
+
+    def record_step_result(step_result: Dict[str, Any]) -> None:
+        # Results are recorded on the calling thread only. The JSON is rewritten at most once per save interval
+        # (and always on failure); run_steps saves once more on exit so no step result is lost.
+        nonlocal last_save, pending_save
+        append_step_result(report_data, step_result)
+        results.append(step_result)
+        now = time.monotonic()
+        if step_result["status"] == "❌" or now - last_save >= save_interval:
+            pending_save = save_executor.submit(save_report_json, copy.deepcopy(report_data), cfg)
+            last_save = now
+
+    def run_step(step_key: str, rpt_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Returns the step result; the scheduler records it on the calling thread
         step = step_funcs[step_key]
         label = step.get("label", step_key)
         func = step["func"]
-        skip_reason = should_skip_step(step, param_values)
+        if label in completed:
+            logger.custom(f"{label} — Skipped (already completed)", indent=0, emoji="⏭️")
+            return {
+                "name": label,
+                "status": "⏭️",
+                "time": "—",
+                "notes": "Skipped (already completed)",
+                "resumed": "true"
+            }
 
+        # Skip conditions are checked when the step is dispatched, so they see what earlier steps left behind
+        skip_reason = should_skip_step(step, param_values)
         if skip_reason:
             logger.custom(f"{label} — {skip_reason}", indent=0, emoji="⏭️")
             step_result = {
@@ -164,14 +237,11 @@ def run_steps(
                 "time": "—",
                 "notes": skip_reason
             }
-            append_step_result(report_data, step_result)
-            save_report_json(report_data, cfg)
-            results.append(step_result)
-            continue
+            return step_result
 
-        backup_occurred = perform_oid_backup(step_key, param_values, cfg, wait_config)
-        perform_wait(step_key, label, wait_config)
-        status, notes, step_start, step_end, elapsed = execute_step(label, func, report_data, step_key=step_key)
+        backup_occurred = perform_oid_backup(step_key, param_values, cfg)
+        perform_wait(step_key, label)
+        status, notes, step_start, step_end, elapsed = execute_step(label, func, rpt_data, step_key=step_key)
 
         # Perform post-step cache clearing for specific steps that modify feature classes
         perform_cache_clearing(step_key, param_values.get("oid_fc"))
@@ -179,16 +249,113 @@ def run_steps(
         step_result = {
             "name": label,
             "status": status,
-            "step_started": step_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "step_ended": step_end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "step_started": _utc_iso(step_start),
+            "step_ended": _utc_iso(step_end),
             "time": elapsed,
             "notes": notes + (" (OID backup created before step)" if backup_occurred else "")
         }
         if backup_occurred:
             step_result["backup_created"] = "true"
-        append_step_result(report_data, step_result)
+        return step_result
+
+    run_keys = step_order[start_index:]
+    for step_key in run_keys:
+        if step_key not in step_funcs:
+            logger.error(f"Step '{step_key}' not found in step_funcs dictionary", error_type=KeyError, indent=0)
+            return results
+
+    # Opt-in resume: steps that already succeeded in a previous run (per the loaded report) are skipped and their
+    # report entry is marked `resumed`. The start step always runs, since re-running from a step is how a successful
+    # step with bad output is redone.
+    completed = set()
+    if cfg.get("orchestrator.resume_completed", False):
+        completed = {
+            s.get("name") for s in report_data.get("steps", [])
+            if isinstance(s, dict) and s.get("status") == "✅"
+        }
+        completed.discard(step_funcs[run_keys[0]].get("label", run_keys[0]) if run_keys else None)
+
+    # Build the dependency graph. Steps without a declared `depends_on` follow the previous step in step_order;
+    # dependencies that precede start_index are treated as already complete.
+    dependencies: Dict[str, set] = {}
+    for idx, step_key in enumerate(run_keys, start=start_index):
+        declared = step_funcs[step_key].get("depends_on")
+        if declared is None:
+            declared = [step_order[idx - 1]] if idx > 0 else []
+        dependencies[step_key] = {dep for dep in declared if dep in run_keys}
+
+    dependents: Dict[str, List[str]] = {key: [] for key in run_keys}
+    for step_key, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(step_key)
+    indegree = {key: len(deps) for key, deps in dependencies.items()}
+    # Ready steps are kept in a heap keyed on their step_order position
+    position = {key: idx for idx, key in enumerate(run_keys)}
+    ready = [(position[key], key) for key in run_keys if indegree[key] == 0]
+    heapq.heapify(ready)
+
+    # arcpy geoprocessing, cursors, the memory workspace and the progressor are not thread-safe, so steps run on the
+    # calling thread unless they are explicitly marked `uses_arcpy: False`. Those may run on up to max_parallel - 1
+    # worker threads while the calling thread works through the arcpy steps. Worker steps write to their own report
+    # dict, which is merged into report_data on the calling thread when they finish.
+    max_parallel = max(1, int(cfg.get("orchestrator.max_parallel", 1) or 1))
+    executor = ThreadPoolExecutor(max_workers=max_parallel - 1) if max_parallel > 1 else None
+    futures: Dict[Future, str] = {}
+    step_reports: Dict[str, Dict[str, Any]] = {}
+    failed = False
+    started = set()
+
+    def runs_on_worker(stp_key: str) -> bool:
+        # An OID backup before the step is an arcpy copy, so such steps stay on the calling thread as well
+        return (executor is not None and step_funcs[stp_key].get("uses_arcpy", True) is False
+                and stp_key not in backup_keys)
+
+    def finish_step(stp_key: str, step_result: Dict[str, Any]) -> None:
+        nonlocal failed
+        record_step_result(step_result)
+        if step_result["status"] == "❌":
+            failed = True
+            return
+        for dependent in dependents[stp_key]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                heapq.heappush(ready, (position[dependent], dependent))
+
+    # Dispatch every step whose dependencies have completed; stop scheduling new work on the first failure
+    try:
+        while True:
+            worker_keys = [key for _, key in sorted(ready) if runs_on_worker(key)] if not failed else []
+            if worker_keys:
+                ready[:] = [item for item in ready if item[1] not in worker_keys]
+                heapq.heapify(ready)
+                for step_key in worker_keys:
+                    started.add(step_key)
+                    step_reports[step_key] = {}
+                    futures[executor.submit(run_step, step_key, step_reports[step_key])] = step_key
+
+            if ready and not failed:
+                _, step_key = heapq.heappop(ready)
+                started.add(step_key)
+                finish_step(step_key, run_step(step_key, report_data))
+            elif futures:
+                wait(futures, return_when=FIRST_COMPLETED)
+            else:
+                break
+
+            for future in [f for f in futures if f.done()]:
+                step_key = futures.pop(future)
+                merge_step_report(report_data, step_reports.pop(step_key))
+                finish_step(step_key, future.result())
+            if failed:
+                for future in [f for f in futures if f.cancel()]:
+                    started.discard(futures.pop(future))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        save_executor.shutdown(wait=True)
         save_report_json(report_data, cfg)
-        results.append(step_result)
-        if status == "❌":
-            break
+
+    if not failed and len(started) < len(run_keys):
+        unresolved = [key for key in run_keys if key not in started]
+        logger.warning(f"Steps not run due to unresolved dependencies: {', '.join(unresolved)}", indent=0)
     return results
@@ -16,8 +16,9 @@
 # File Location:        /utils/update_linear_and_custom.py
 # Validator:            /utils/validators/update_linear_and_custom_validator.py
 # Called By:            tools/update_linear_and_custom_tool.py, orchestrator
-# Int. Dependencies:    utils.manager.config_manager, utils.shared.expression_utils
-# Ext. Dependencies:    arcpy, typing
+# Int. Dependencies:    utils.manager.config_manager, utils.shared.arcpy_utils, utils.shared.expression_utils,
+#                       utils.shared.route_index
+# Ext. Dependencies:    arcpy, functools, heapq, numpy, os, typing
 #
 # Documentation:
 #   See: docs_legacy/TOOL_GUIDES.md and docs_legacy/tools/update_linear_and_custom.md
@@ -30,13 +31,151 @@
 __all__ = ["update_linear_and_custom"]
 
 import arcpy
-from typing import Optional
+import heapq
+import os
+import numpy as np
+from functools import lru_cache
+from typing import Optional, Any, Callable, Dict, List, Sequence, Tuple
 
 from utils.manager.config_manager import ConfigManager
-from utils.shared.expression_utils import resolve_expression
+from utils.shared.arcpy_utils import workspace_stamp
+from utils.shared.expression_utils import compile_expression, resolve_expression
+from utils.shared.route_index import build_route_index, route_distances
 
+# CalculateField code block for JOIN_KEY ("Reel_Frame", with UNKNOWN for missing parts)
+JOIN_KEY_CODE_BLOCK = """def join_key(reel, frame):
+    return f"{reel if reel else 'UNKNOWN'}_{frame if frame else 'UNKNOWN'}"
+"""
 
-def get_located_points(oid_fc: str, centerline_fc: str, route_id_field:str, logger) -> dict:
+# Rows written per UpdateCursor; each batch covers one OBJECTID range so the edit lock is released between batches
+UPDATE_BATCH_SIZE = 20000
+
+# Largest OID feature count whose LocateFeaturesAlongRoutes event table is kept in the "memory" workspace; larger
+# datasets fall back to the on-disk scratch geodatabase. The projected point copy always goes to the scratch
+# geodatabase, since Project does not support the memory workspace as an output location
+MEMORY_SCRATCH_MAX_FEATURES = 250000
+
+
+@lru_cache(maxsize=8)
+def _load_routes_cached(centerline_fc: str, stamp: float) -> Tuple[Any, ...]:
+    return tuple(row[0] for row in arcpy.da.SearchCursor(centerline_fc, ["SHAPE@"]))
+
+
+def load_routes(centerline_fc: str) -> Tuple[Any, ...]:
+    """
+    Returns the route geometries of a centerline feature class.
+
+    Results are memoized by path and workspace modification stamp, so repeated runs against an unchanged centerline
+    skip the SearchCursor; if no stamp is available the routes are read fresh.
+    """
+    stamp = workspace_stamp(centerline_fc)
+    if stamp is None:
+        return tuple(row[0] for row in arcpy.da.SearchCursor(centerline_fc, ["SHAPE@"]))
+    return _load_routes_cached(str(centerline_fc), stamp)
+
+
+class LocatedPoints:
+    """
+    Route locations for located OIDs, stored as parallel arrays (route IDs and MP values, NaN when unknown) with an
+    OID -> position map, in place of one small dict per OID.
+    """
+    __slots__ = ("_index", "route_ids", "mp_values")
+
+    def __init__(self, oids: Sequence[int] = (), route_ids: Sequence[Any] = (), mp_values: Sequence[float] = ()):
+        self._index = {oid: i for i, oid in enumerate(oids)}
+        self.route_ids = np.asarray(route_ids, dtype=object)
+        self.mp_values = np.asarray(mp_values, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, oid: int) -> bool:
+        return oid in self._index
+
+    def get(self, oid: int) -> Optional[Tuple[Any, Optional[float]]]:
+        """Returns (route_id, mp_value) for a located OID, with mp_value None if no valid MP was found."""
+        i = self._index.get(oid)
+        if i is None:
+            return None
+        mp = self.mp_values[i]
+        return self.route_ids[i], (None if np.isnan(mp) else float(mp))
+
+
+def _route_extents(routes: Sequence[Any]) -> np.ndarray:
+    """Returns an (R, 4) array of route extents as XMin, YMin, XMax, YMax."""
+    return np.array([(r.extent.XMin, r.extent.YMin, r.extent.XMax, r.extent.YMax) for r in routes],
+                    dtype=np.float64).reshape(-1, 4)
+
+
+def _nearest_route_distance(point, routes: Sequence[Any], extents: np.ndarray) -> float:
+    """
+    Returns the distance from a point to the nearest route using extent pruning.
+
+    The distance to a route's extent is a lower bound on the distance to the route, so routes are queried in order of
+    extent distance and the scan stops once no remaining extent can beat the best exact distance found.
+    """
+    dx = np.maximum(np.maximum(extents[:, 0] - point.X, point.X - extents[:, 2]), 0)
+    dy = np.maximum(np.maximum(extents[:, 1] - point.Y, point.Y - extents[:, 3]), 0)
+    lower = np.hypot(dx, dy)
+    best = float("inf")
+    for i in np.argsort(lower):
+        if lower[i] >= best:
+            break
+        best = min(best, routes[i].queryPointAndDistance(point, use_percentage=False)[2])
+    return best
+
+
+def _max_near_distance(points_fc: str, centerline_fc: str, nearest_route_distance, logger) -> float:
+    """
+    Returns the largest point-to-nearest-route distance using one GenerateNearTable call.
+
+    Falls back to per-point nearest_route_distance queries if the near table cannot be generated.
+    """
+    near_table = arcpy.CreateUniqueName("oid_near_table", "memory")
+    try:
+        arcpy.analysis.GenerateNearTable(points_fc, centerline_fc, near_table, method="PLANAR", closest="CLOSEST")
+        near_dist = arcpy.da.TableToNumPyArray(near_table, ["NEAR_DIST"])["NEAR_DIST"]
+        return float(near_dist.max()) if len(near_dist) else 0.0
+    except Exception as e:
+        logger.warning(f"Near table failed; measuring route distances per point: {e}", indent=1)
+        max_dist = 0.0
+        with arcpy.da.SearchCursor(points_fc, ["SHAPE@"]) as cursor:
+            for (point_geom,) in cursor:
+                max_dist = max(max_dist, nearest_route_distance(point_geom.centroid))
+        return max_dist
+    finally:
+        if arcpy.Exists(near_table):
+            arcpy.management.Delete(near_table)
+
+
+def _ensure_spatial_index(fc: str, logger) -> None:
+    """Adds a spatial index to a scratch feature class that lacks one; failures are logged and ignored."""
+    try:
+        desc = arcpy.Describe(fc)
+        if desc.dataType == "FeatureClass" and not desc.hasSpatialIndex:
+            arcpy.management.AddSpatialIndex(fc)
+            logger.debug(f"Added spatial index to {fc}", indent=2)
+    except Exception as e:
+        logger.warning(f"Could not add spatial index to {fc}: {e}", indent=2)
+
+
+def _event_input_oid_field(event_table: str, input_features: str) -> str:
+    """
+    Returns the field holding input ObjectIDs in a LocateFeaturesAlongRoutes event table written with NO_FIELDS.
+
+    The tool names that field INPUTOID, or "<input name>_OID" in some releases; either is matched by name, and any
+    other layout raises rather than joining on the wrong column.
+    """
+    input_name = os.path.splitext(os.path.basename(str(input_features)))[0]
+    field_names = {field.name.upper(): field.name for field in arcpy.ListFields(event_table)}
+    for candidate in ("INPUTOID", f"{input_name}_OID"):
+        if candidate.upper() in field_names:
+            return field_names[candidate.upper()]
+    raise RuntimeError(f"No INPUTOID or {input_name}_OID field found in event table {event_table}")
+
+
+def get_located_points(oid_fc: str, centerline_fc: str, route_id_field:str, logger,
+                       feature_count: Optional[int] = None) -> "LocatedPoints":
     """
     Finds the route identifier and milepost value for each point in the OID feature class by projecting it to the
     centerline's spatial reference and locating features along routes.
@@ -46,81 +185,115 @@ def get_located_points(oid_fc: str, centerline_fc: str, route_id_field:str, logg
     point with its nearest route and milepost value.
 
     Returns:
-        dict: A mapping from each object ID (OID) to a dictionary with 'route_id' and 'mp_value' keys.
+        LocatedPoints: Route ID and milepost value per located object ID (OID); empty if referencing fails.
+
+    feature_count is the OID feature count when the caller already has it; otherwise it is counted here.
     """
+    scratch_items = []
     try:
 
         # Get target spatial reference
         route_sr = arcpy.Describe(centerline_fc).spatialReference
 
         # Add a join field that combines Reel and Frame for unique identification BEFORE projecting
-        arcpy.management.AddField(oid_fc, "JOIN_KEY", "TEXT", field_length=20, field_alias="Reel_Frame Join Key")
-
-        # Populate the join key field with "Reel_Frame" format
-        with arcpy.da.UpdateCursor(oid_fc, ["Reel", "Frame", "JOIN_KEY"]) as cursor:
-            for row in cursor:
-                reel = row[0] if row[0] else "UNKNOWN"
-                frame = row[1] if row[1] else "UNKNOWN"
-                row[2] = f"{reel}_{frame}"
-                cursor.updateRow(row)
-
-        # Project OID feature class with the JOIN_KEY field included
-        projected_oid_fc = arcpy.CreateUniqueName("projected_oid_fc", arcpy.env.scratchGDB)
-
-        arcpy.management.Project(
-            in_dataset=oid_fc,
-            out_dataset=projected_oid_fc,
-            out_coor_system=route_sr
+        # (reused if a previous run already added it)
+        if not arcpy.ListFields(oid_fc, "JOIN_KEY"):
+            arcpy.management.AddField(oid_fc, "JOIN_KEY", "TEXT", field_length=20, field_alias="Reel_Frame Join Key")
+
+        # Populate the join key field with "Reel_Frame" format in a single engine-side calculation
+        arcpy.management.CalculateField(
+            in_table=oid_fc,
+            field="JOIN_KEY",
+            expression="join_key(!Reel!, !Frame!)",
+            expression_type="PYTHON3",
+            code_block=JOIN_KEY_CODE_BLOCK
         )
 
-
-
-        # Load all route geometries
-        routes = [row[0] for row in arcpy.da.SearchCursor(centerline_fc, ["SHAPE@"])]
-
-        # Compute adaptive tolerance based on max distance from OID points to nearest route
+        # The event table stays in RAM unless the dataset is too large for the memory workspace
+        if feature_count is None:
+            feature_count = int(arcpy.management.GetCount(oid_fc)[0])
+        table_ws = "memory" if feature_count <= MEMORY_SCRATCH_MAX_FEATURES else arcpy.env.scratchGDB
+
+        # Project OID feature class with the JOIN_KEY field included; when it already shares the centerline's
+        # spatial reference it is used directly instead of copying the whole dataset to scratch
+        oid_sr = arcpy.Describe(oid_fc).spatialReference
+        if oid_sr.factoryCode and oid_sr.factoryCode == route_sr.factoryCode:
+            projected_oid_fc = oid_fc
+            logger.debug("OID already matches the centerline spatial reference; skipping projection.", indent=2)
+        else:
+            projected_oid_fc = arcpy.CreateUniqueName("projected_oid_fc", arcpy.env.scratchGDB)
+            scratch_items.append(projected_oid_fc)
+            arcpy.management.Project(
+                in_dataset=oid_fc,
+                out_dataset=projected_oid_fc,
+                out_coor_system=route_sr
+            )
+
+        # LocateFeaturesAlongRoutes prunes candidates through spatial indexes. Only the scratch copy is indexed:
+        # the user's OID and centerline feature classes are never altered
+        if projected_oid_fc is not oid_fc:
+            _ensure_spatial_index(projected_oid_fc, logger)
+
+        # Load all route geometries (reused while the centerline workspace is unchanged)
+        routes = load_routes(centerline_fc)
+        if not routes:
+            logger.warning("No route geometries found - skipping linear referencing.", indent=1)
+            return LocatedPoints()
+
+        # Spatial lookups: the KD-tree route index when SciPy is available, otherwise route extents prune the
+        # exact queryPointAndDistance calls to the routes that can still be nearest
+        route_index = build_route_index(routes, route_sr, logger)
+        route_extents = _route_extents(routes)
+
+        def nearest_route_distance(point) -> float:
+            if route_index is not None:
+                return float(route_distances(route_index, np.array([point.X]), np.array([point.Y]))[0])
+            return _nearest_route_distance(point, routes, route_extents)
+
+        # Compute adaptive tolerance based on max distance from OID points to nearest route: one vectorized
+        # KD-tree query over all points when SciPy is available, otherwise a single near table
         max_dist = 0
-        with arcpy.da.SearchCursor(projected_oid_fc, ["SHAPE@"]) as cursor:
-            for (point_geom,) in cursor:
-                point = point_geom.centroid
-                if not routes:
-                    logger.warning("No route geometries found - skipping linear referencing.", indent=1)
-                    return {}
-                min_dist = min(route.queryPointAndDistance(point, use_percentage=False)[2] for route in routes)
-                max_dist = max(max_dist, min_dist)
+        sample_distances = []  # First few (JOIN_KEY, distance) pairs for the debug diagnostics
+        if route_index is not None:
+            pts = arcpy.da.FeatureClassToNumPyArray(
+                projected_oid_fc, ["SHAPE@XY", "JOIN_KEY"], null_value={"JOIN_KEY": ""}
+            )
+            if len(pts):
+                xy = pts["SHAPE@XY"]
+                dists = route_distances(route_index, xy[:, 0], xy[:, 1])
+                max_dist = float(dists.max())
+                sample_distances = list(zip(pts["JOIN_KEY"][:3].tolist(), dists[:3].tolist()))
+        else:
+            max_dist = _max_near_distance(projected_oid_fc, centerline_fc, nearest_route_distance, logger)
         tolerance = round(max_dist + 5, 2)
 
         logger.info(f"📏 Max distance to nearest route: {round(max_dist, 2)} → Using {round(tolerance, 2)} tolerance", indent=1)
 
         # Perform location along routes
-        oid_table = arcpy.CreateUniqueName("oid_temp_table", arcpy.env.scratchGDB)
+        oid_table = arcpy.CreateUniqueName("oid_temp_table", table_ws)
+        scratch_items.append(oid_table)
 
-        if logger:
-            # Count input features and log spatial state for debugging
-            input_count = int(arcpy.GetCount_management(projected_oid_fc)[0])
-            orig_count = int(arcpy.GetCount_management(oid_fc)[0])
+        if logger.debug_enabled:
+            # Log input size and spatial state for debugging
             desc = arcpy.Describe(oid_fc)
             logger.debug(f"📍 Linear referencing input diagnostics:", indent=2)
-            logger.debug(f"   • Original features: {orig_count}", indent=3)
-            logger.debug(f"   • Projected features: {input_count}", indent=3)
+            logger.debug(f"   • Input features: {feature_count}", indent=3)
             logger.debug(f"   • Has spatial index: {desc.hasSpatialIndex}", indent=3)
             logger.debug(f"   • Tolerance: {tolerance} (max distance was {round(max_dist, 2)})", indent=3)
 
-            # Sample a few join keys and their distances to route for debugging
-            sample_distances = []
-            with arcpy.da.SearchCursor(projected_oid_fc, ["JOIN_KEY", "SHAPE@"]) as cursor:
-                for i, (join_key, geom) in enumerate(cursor):
-                    if i >= 3:  # Just sample first 3
-                        break
-                    if routes:
-                        point = geom.centroid
-                        min_dist = min(route.queryPointAndDistance(point, use_percentage=False)[2] for route in routes)
-                        sample_distances.append(f"JOIN_KEY {join_key}: {round(min_dist, 2)}m from route")
+            # Sample a few join keys and their distances to route; the KD-tree pass already measured them,
+            # the near-table fallback only keeps the maximum
+            if not sample_distances:
+                with arcpy.da.SearchCursor(projected_oid_fc, ["JOIN_KEY", "SHAPE@"]) as cursor:
+                    for i, (join_key, geom) in enumerate(cursor):
+                        if i >= 3:  # Just sample first 3
+                            break
+                        sample_distances.append((join_key, nearest_route_distance(geom.centroid)))
 
             if sample_distances:
                 logger.debug(f"   • Sample distances to route:", indent=3)
-                for dist_info in sample_distances:
-                    logger.debug(f"     - {dist_info}", indent=4)
+                for join_key, min_dist in sample_distances:
+                    logger.debug(f"     - JOIN_KEY {join_key}: {round(min_dist, 2)}m from route", indent=4)
 
         arcpy.lr.LocateFeaturesAlongRoutes(
             in_features=projected_oid_fc,
@@ -131,60 +304,59 @@ def get_located_points(oid_fc: str, centerline_fc: str, route_id_field:str, logg
             out_event_properties=f"{route_id_field} POINT MP",
             route_locations="FIRST",
             distance_field="NO_DISTANCE",
-            in_fields="FIELDS"  # Include all fields from input features
+            in_fields="NO_FIELDS"  # Only the event properties and input ObjectIDs; JOIN_KEY is looked up below
         )
 
-        if logger:
+        if logger.debug_enabled:
             # Count output records for debugging
             output_count = int(arcpy.GetCount_management(oid_table)[0])
             logger.debug(f"📍 LocateFeaturesAlongRoutes produced {output_count} records", indent=2)
 
-        # Parse result table into a dict using JOIN_KEY, then map back to OBJECTIDs
-        join_key_to_loc = {}
-        total_located = 0
-        invalid_mp_values = []
-        sample_values = []  # For debugging - collect sample of MP values
-        null_mp_join_keys = []   # Track join keys that got NULL MP values from LocateFeaturesAlongRoutes
-        with arcpy.da.SearchCursor(oid_table, [route_id_field, "MP", "JOIN_KEY"]) as cursor:
-            for route_id_val, mp, join_key in cursor:
-                # Track NULL MP values from LocateFeaturesAlongRoutes
-                if mp is None:
-                    null_mp_join_keys.append(join_key)
-
-                # Validate and clean MP value
-                cleaned_mp = None
-                if mp is not None:
-                    # Check for various invalid values that LocateFeaturesAlongRoutes might return
-                    if isinstance(mp, str):
-                        mp = mp.strip()
-                        if mp == "" or mp.lower() in ["nan", "null", "none"]:
-                            mp = None
-
-                    if mp is not None:
-                        try:
-                            cleaned_mp = float(mp)
-                            # Check for NaN or infinite values
-                            if not (cleaned_mp == cleaned_mp and abs(cleaned_mp) != float('inf')):  # NaN check
-                                cleaned_mp = None
-                                invalid_mp_values.append(f"JOIN_KEY {join_key}: NaN/Inf value")
-                        except (ValueError, TypeError) as e:
-                            invalid_mp_values.append(f"JOIN_KEY {join_key}: '{mp}' ({type(mp).__name__})")
-                            cleaned_mp = None
-
-                join_key_to_loc[join_key] = {"route_id": route_id_val, "mp_value": cleaned_mp}
-                if cleaned_mp is not None:
-                    total_located += 1
-
-                # Collect sample for debugging (first 5 records)
-                if len(sample_values) < 5:
-                    sample_values.append(f"JOIN_KEY {join_key}: {repr(mp)} -> {cleaned_mp}")
+        # Parse result table into parallel route/MP arrays indexed by JOIN_KEY, then map back to OBJECTIDs; the
+        # event table references the located features by their ObjectIDs in projected_oid_fc
+        input_oid_field = _event_input_oid_field(oid_table, projected_oid_fc)
+        loc_arr = arcpy.da.TableToNumPyArray(
+            oid_table, [route_id_field, "MP", input_oid_field], null_value={"MP": np.nan}
+        )
+        key_arr = arcpy.da.FeatureClassToNumPyArray(projected_oid_fc, ["OID@", "JOIN_KEY"], null_value={"JOIN_KEY": ""})
+        join_key_by_input_oid = dict(zip(key_arr["OID@"].tolist(), key_arr["JOIN_KEY"].tolist()))
+        join_keys = [join_key_by_input_oid.get(oid, "") for oid in loc_arr[input_oid_field].tolist()]
+        loc_mp_values = loc_arr["MP"].astype(np.float64)
+        loc_route_ids = loc_arr[route_id_field].tolist()
+
+        # NULL MP values from LocateFeaturesAlongRoutes arrive as NaN; anything else non-finite is invalid
+        null_mask = np.isnan(loc_mp_values)
+        valid_mask = np.isfinite(loc_mp_values)
+        null_mp_join_keys = [join_keys[i] for i in np.flatnonzero(null_mask)]
+        invalid_mp_values = [
+            f"JOIN_KEY {join_keys[i]}: NaN/Inf value" for i in np.flatnonzero(~valid_mask & ~null_mask)
+        ]
+        loc_mp_values[~valid_mask] = np.nan
+        total_located = int(valid_mask.sum())
+        join_key_idx = {join_key: i for i, join_key in enumerate(join_keys)}
+
+        # Collect sample for debugging (first 5 records)
+        sample_values = [
+            f"JOIN_KEY {join_keys[i]}: {None if null_mask[i] else float(loc_arr['MP'][i])!r} -> "
+            f"{float(loc_mp_values[i]) if valid_mask[i] else None}"
+            for i in range(min(5, len(join_keys)))
+        ] if logger.debug_enabled else []
 
         # Now map the join_key results back to OBJECTIDs
-        oid_to_loc = {}
-        with arcpy.da.SearchCursor(oid_fc, ["OBJECTID", "JOIN_KEY"]) as cursor:
-            for oid, join_key in cursor:
-                if join_key in join_key_to_loc:
-                    oid_to_loc[oid] = join_key_to_loc[join_key]
+        oid_arr = arcpy.da.TableToNumPyArray(oid_fc, ["OBJECTID", "JOIN_KEY"], null_value={"JOIN_KEY": ""})
+        located_oids = []
+        located_rows = []
+        for oid, join_key in zip(oid_arr["OBJECTID"].tolist(), oid_arr["JOIN_KEY"].tolist()):
+            loc_idx = join_key_idx.get(join_key)
+            if loc_idx is not None:
+                located_oids.append(oid)
+                located_rows.append(loc_idx)
+        located_rows = np.asarray(located_rows, dtype=np.int64)
+        oid_to_loc = LocatedPoints(
+            located_oids,
+            np.asarray(loc_route_ids, dtype=object)[located_rows],
+            np.asarray(loc_mp_values, dtype=np.float64)[located_rows]
+        )
 
         if logger:
             logger.info(f"📏 Linear referencing results: {total_located}/{len(oid_to_loc)} images located along route", indent=2)
@@ -204,22 +376,15 @@ def get_located_points(oid_fc: str, centerline_fc: str, route_id_field:str, logg
                     sample_nulls = sorted(null_mp_join_keys)[:5]
                     logger.warning(f"  Sample NULL MP join keys: {sample_nulls} (and {len(null_mp_join_keys)-5} more)", indent=3)
 
-                # Check distances for NULL join keys to see if they're within tolerance
-                logger.debug(f"Investigating NULL join key distances to route:", indent=3)
-                routes = [row[0] for row in arcpy.da.SearchCursor(centerline_fc, ["SHAPE@"])]
-                null_distances = []
-                if null_mp_join_keys[:5]:  # Only if we have NULL join keys to investigate
+                # Check distances for NULL join keys to see if they're within tolerance (debug output only)
+                if logger.debug_enabled:
+                    logger.debug(f"Investigating NULL join key distances to route:", indent=3)
                     join_key_list = "','".join(null_mp_join_keys[:5])
                     with arcpy.da.SearchCursor(projected_oid_fc, ["JOIN_KEY", "SHAPE@"], where_clause=f"JOIN_KEY IN ('{join_key_list}')") as cursor:
                         for join_key, geom in cursor:
-                            if routes and geom:
-                                point = geom.centroid
-                                min_dist = min(route.queryPointAndDistance(point, use_percentage=False)[2] for route in routes)
-                                null_distances.append(f"JOIN_KEY {join_key}: {round(min_dist, 2)}m (tolerance: {round(tolerance, 2)}m)")
-
-                if null_distances:
-                    for dist_info in null_distances:
-                        logger.debug(f"  • {dist_info}", indent=4)
+                            if geom:
+                                min_dist = nearest_route_distance(geom.centroid)
+                                logger.debug(f"  • JOIN_KEY {join_key}: {round(min_dist, 2)}m (tolerance: {round(tolerance, 2)}m)", indent=4)
 
             if invalid_mp_values:
                 logger.warning(f"Found {len(invalid_mp_values)} invalid MP values:", indent=2)
@@ -232,65 +397,102 @@ def get_located_points(oid_fc: str, centerline_fc: str, route_id_field:str, logg
 
     except Exception as e:
         logger.warning(f"Linear referencing failed: {e}", indent=1)
-        return {}
+        return LocatedPoints()
+
+    finally:
+        for item in scratch_items:
+            if arcpy.Exists(item):
+                arcpy.management.Delete(item)
+
+
+class _RowView:
+    """Read-only, dict-like view of a cursor row by field name; stands in for a per-row context dict."""
+    __slots__ = ("_values", "_field_idx")
+
+    def __init__(self, values: Sequence[Any], field_idx: Dict[str, int]):
+        self._values = values
+        self._field_idx = field_idx
+
+    def get(self, key: str, default: Any = None) -> Any:
+        idx = self._field_idx.get(key)
+        return default if idx is None else self._values[idx]
 
 
-from typing import List, Dict, Any, Tuple
+def build_linear_plan(linear_fields: Dict, field_idx: Dict[str, int]) -> List[Tuple[str, str, int, str]]:
+    """
+    Resolves the route identifier and route measure entries of linear_fields into (key, field name, row index, field
+    type) tuples, so the per-row update does not re-inspect the field definitions.
+    """
+    return [
+        (key, field_def.get("name"), field_idx[field_def.get("name")], field_def.get("type"))
+        for key, field_def in linear_fields.items()
+        if key in ("route_identifier", "route_measure")
+    ]
+
 
 def compute_linear_and_custom_updates(
     cfg: ConfigManager,
-    row: List[Any],
+    row: Sequence[Any],
     update_fields: List[str],
     linear_fields: Dict,
     custom_field_defs: List[Tuple[str, str, str, str]],
-    oid_to_loc: Dict,
+    oid_to_loc: "LocatedPoints",
     enable_linear_ref: bool,
-    logger=None
+    logger=None,
+    field_idx: Optional[Dict[str, int]] = None,
+    compiled_expressions: Optional[List[Callable[[Optional[dict]], Any]]] = None,
+    linear_plan: Optional[List[Tuple[str, str, int, str]]] = None
 ) -> Tuple[List[Any], bool]:
     """
-    Given a row and config, return the updated row and a boolean indicating if it was changed.
+    Given a row and config, return the updated row (a new list; the input row is not modified) and a boolean
+    indicating if it was changed. Custom expressions see the row's original values.
+
+    field_idx maps each name in update_fields to its row position, and compiled_expressions holds one
+    compile_expression resolver per custom_field_defs entry; linear_plan is the output of build_linear_plan. Callers
+    processing many rows should build all three once and pass them in.
     """
+    if field_idx is None:
+        field_idx = {name: i for i, name in enumerate(update_fields)}
+    if linear_plan is None:
+        linear_plan = build_linear_plan(linear_fields, field_idx)
     update = False
-    context = dict(zip(update_fields, row))
+    context = _RowView(row, field_idx)
+    row = list(row)
     oid = row[0]
     # Linear reference updates
     if enable_linear_ref:
         loc = oid_to_loc.get(oid)
         route_id = mp_value = None
         if loc:
-            route_id = loc.get("route_id")
-            mp_value = loc.get("mp_value")
-        for key, field_def in linear_fields.items():
-            field_name = field_def.get("name")
-            if key == "route_identifier":
-                value = route_id
-            elif key == "route_measure":
-                value = mp_value
-            else:
-                continue
+            route_id, mp_value = loc
+        for key, field_name, idx, field_type in linear_plan:
+            value = route_id if key == "route_identifier" else mp_value
 
             # Skip update if value is None (failed to locate along route)
             if value is None:
                 continue
 
-            idx = update_fields.index(field_name)
-            if field_def["type"] == "DOUBLE":
+            if field_type == "DOUBLE":
                 try:
                     value = float(value)
                 except (ValueError, TypeError):
                     if logger:
                         logger.warning(f"OID {oid}: Could not convert {field_name} value '{value}' (type: {type(value).__name__}) to float", indent=2)
                         # Log additional context for debugging
-                        logger.debug(f"  Raw mp_value from locate: {repr(mp_value)}", indent=3)
-                        logger.debug(f"  Route ID: {route_id}", indent=3)
+                        if logger.debug_enabled:
+                            logger.debug(f"  Raw mp_value from locate: {repr(mp_value)}", indent=3)
+                            logger.debug(f"  Route ID: {route_id}", indent=3)
                     value = None
             row[idx] = value
             update = True
     # Custom field updates
-    for _, target_field, expression, field_type in custom_field_defs:
+    for i, (_, target_field, expression, field_type) in enumerate(custom_field_defs):
         try:
-            # resolve_expression may raise
-            value = resolve_expression(expression, cfg, row=context)
+            # resolvers may raise
+            if compiled_expressions:
+                value = compiled_expressions[i](context)
+            else:
+                value = resolve_expression(expression, cfg, row=context)
             if field_type == "DOUBLE":
                 try:
                     value = float(value)
@@ -298,7 +500,7 @@ def compute_linear_and_custom_updates(
                     if logger:
                         logger.warning(f"Could not convert value for {target_field} to float.", indent=2)
                     continue
-            row[update_fields.index(target_field)] = value
+            row[field_idx[target_field]] = value
             update = True
         except Exception as e:
             if logger:
@@ -335,69 +537,106 @@ def update_linear_and_custom(
 
     # Load custom field definitions
     custom_fields = cfg.get("oid_schema_template.custom_fields", {})
-    custom_field_defs = [
+    custom_field_defs = tuple(
         (key, field["name"], field.get("expression"), field.get("type"))
         for key, field in custom_fields.items()
         if "expression" in field
-    ]
+    )
     custom_field_names = [name for _, name, _, _ in custom_field_defs]
+    compiled_expressions = [compile_expression(expr, cfg) for _, _, expr, _ in custom_field_defs]
 
     update_fields = ["OID@"] + linear_field_names + custom_field_names
+    field_idx = {name: i for i, name in enumerate(update_fields)}
+    linear_plan = build_linear_plan(linear_fields, field_idx)
+
+    if not custom_field_defs and not linear_plan:
+        logger.info("No linear referencing or custom expression fields to update.", indent=1)
+        return
+    linear_only = not custom_field_defs
+
+    row_count = int(arcpy.management.GetCount(oid_fc_path)[0])
 
     # 🔁 Only run linear referencing if requested
-    oid_to_loc = {}
+    oid_to_loc = LocatedPoints()
     if enable_linear_ref and centerline_fc and route_id_field:
-        oid_to_loc = get_located_points(oid_fc_path, centerline_fc, route_id_field, logger)
+        oid_to_loc = get_located_points(oid_fc_path, centerline_fc, route_id_field, logger, feature_count=row_count)
 
-    row_count = int(arcpy.management.GetCount(oid_fc_path)[0])
+    progress_step = max(1, row_count // 200)
 
-    # Update records
+    # Update records in two passes: compute every row's new values from a read-only cursor, then write only the
+    # changed rows, so expression evaluation is not interleaved with edit-cursor writes
     updated_oids = set()
     failed_oids = set()
     skipped_mp_oids = set()  # Track OIDs that couldn't be assigned MP values
+    pending_updates = {}
     with cfg.get_progressor(total=row_count, label="Updating linear/custom fields") as progressor:
-        with arcpy.da.UpdateCursor(oid_fc_path, update_fields) as cursor:
+        with arcpy.da.SearchCursor(oid_fc_path, update_fields) as cursor:
             for i, row in enumerate(cursor, start=1):
                 oid = row[0]
-                try:
-                    new_row, update = compute_linear_and_custom_updates(
-                        cfg=cfg,
-                        row=list(row),
-                        update_fields=update_fields,
-                        linear_fields=linear_fields,
-                        custom_field_defs=custom_field_defs,
-                        oid_to_loc=oid_to_loc,
-                        enable_linear_ref=enable_linear_ref,
-                        logger=logger
-                    )
-                    if update:
+                if linear_only and oid not in oid_to_loc:
+                    # Without custom fields, rows that were not located have nothing to update
+                    skipped_mp_oids.add(oid)
+                else:
+                    try:
+                        new_row, update = compute_linear_and_custom_updates(
+                            cfg=cfg,
+                            row=row,
+                            update_fields=update_fields,
+                            linear_fields=linear_fields,
+                            custom_field_defs=custom_field_defs,
+                            oid_to_loc=oid_to_loc,
+                            enable_linear_ref=enable_linear_ref,
+                            logger=logger,
+                            field_idx=field_idx,
+                            compiled_expressions=compiled_expressions,
+                            linear_plan=linear_plan
+                        )
+                        if update:
+                            pending_updates[oid] = new_row
+
+                        # Check if MP_Num assignment was skipped (only if linear referencing is enabled)
+                        if enable_linear_ref:
+                            loc = oid_to_loc.get(oid)
+                            if loc is None or loc[1] is None:
+                                # OID not found in linear referencing results at all, or found without an MP value
+                                skipped_mp_oids.add(oid)
+                    except Exception as e:
+                        failed_oids.add(oid)
+                        logger.error(f"Failed to update OID {oid}: {e}", indent=2)
+                if i % progress_step == 0 or i == row_count:
+                    progressor.update(i)
+
+    if pending_updates:
+        oid_field = arcpy.Describe(oid_fc_path).OIDFieldName
+        sorted_oids = sorted(pending_updates)
+        for start in range(0, len(sorted_oids), UPDATE_BATCH_SIZE):
+            batch = sorted_oids[start:start + UPDATE_BATCH_SIZE]
+            where_clause = f"{oid_field} >= {batch[0]} AND {oid_field} <= {batch[-1]}"
+            with arcpy.da.UpdateCursor(oid_fc_path, update_fields, where_clause) as cursor:
+                for row in cursor:
+                    oid = row[0]
+                    new_row = pending_updates.get(oid)
+                    if new_row is None:
+                        continue
+                    try:
                         cursor.updateRow(new_row)
                         updated_oids.add(oid)
-
-                    # Check if MP_Num assignment was skipped (only if linear referencing is enabled)
-                    if enable_linear_ref:
-                        if oid not in oid_to_loc:
-                            # OID not found in linear referencing results at all
-                            skipped_mp_oids.add(oid)
-                        elif oid_to_loc[oid].get("mp_value") is None:
-                            # OID found but MP value is None
-                            skipped_mp_oids.add(oid)
-                except Exception as e:
-                    failed_oids.add(oid)
-                    logger.error(f"Failed to update OID {oid}: {e}", indent=2)
-                progressor.update(i)
+                    except Exception as e:
+                        failed_oids.add(oid)
+                        logger.error(f"Failed to update OID {oid}: {e}", indent=2)
     logger.success(f"Updated {len(updated_oids)} feature(s) with linear and custom attributes." + (f" Failed to update {len(failed_oids)} OIDs." if failed_oids else ""), indent=1)
 
     # Report MP assignment results
     if enable_linear_ref and skipped_mp_oids:
         logger.warning(f"⚠️ Skipped MP assignment for {len(skipped_mp_oids)} feature(s) - MP values were None", indent=1)
-        if len(skipped_mp_oids) <= 10:
-            logger.debug(f"Skipped MP OIDs: {sorted(skipped_mp_oids)}", indent=2)
-        else:
-            sample_skipped = sorted(skipped_mp_oids)[:5]
-            logger.debug(f"Sample skipped MP OIDs: {sample_skipped} (and {len(skipped_mp_oids)-5} more)", indent=2)
+        if logger.debug_enabled:
+            if len(skipped_mp_oids) <= 10:
+                logger.debug(f"Skipped MP OIDs: {sorted(skipped_mp_oids)}", indent=2)
+            else:
+                sample_skipped = heapq.nsmallest(5, skipped_mp_oids)
+                logger.debug(f"Sample skipped MP OIDs: {sample_skipped} (and {len(skipped_mp_oids)-5} more)", indent=2)
 
-    if updated_oids:
+    if updated_oids and logger.debug_enabled:
         logger.debug(f"Updated OIDs: {sorted(updated_oids)}", indent=2)
     if failed_oids:
         logger.warning(f"Failed OIDs: {sorted(failed_oids)}", indent=2)
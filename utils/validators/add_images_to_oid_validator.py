@@ -21,10 +21,14 @@ from utils.shared.rmi_exceptions import ConfigValidationError
 from utils.shared.expression_utils import load_field_registry
 from utils.validators.common_validators import (
     validate_field_block,
-    validate_type, check_file_exists
+    validate_type, check_file_exists, filesystem_dependent
 )
 
+VALID_IMAGE_TYPES = frozenset({"360", "Oblique", "Nadir", "Perspective", "Inspection"})
+_VALID_IMAGE_TYPES_MSG = ", ".join(sorted(VALID_IMAGE_TYPES))
 
+
+@filesystem_dependent
 def validate(cfg: "ConfigManager") -> bool:
     """
     Validates the configuration for adding images to an Oriented Imagery Dataset.
@@ -58,13 +62,11 @@ def validate(cfg: "ConfigManager") -> bool:
     if not validate_field_block(field, cfg, context="registry.OrientedImageryType"):
         error_count += 1
 
-    VALID_IMAGE_TYPES = {"360", "Oblique", "Nadir", "Perspective", "Inspection"}
-
     default = field.get("oid_default")
     if not validate_type(default, "OrientedImageryType.oid_default", str, cfg):
         error_count += 1
     elif default not in VALID_IMAGE_TYPES:
-        logger.error(f"OrientedImageryType.oid_default must be one of: {', '.join(sorted(VALID_IMAGE_TYPES))}",
+        logger.error(f"OrientedImageryType.oid_default must be one of: {_VALID_IMAGE_TYPES_MSG}",
                      error_type=ConfigValidationError)
         error_count += 1
 
@@ -20,9 +20,17 @@
 from utils.shared.rmi_exceptions import ConfigValidationError
 from utils.validators.common_validators import (
     validate_type,
-    try_resolve_config_expression
+    try_resolve_config_expression,
+    filesystem_dependent
 )
 
+REQUIRED_METADATA_FIELDS = frozenset({
+    "Artist", "Copyright", "Software", "Make", "Model", "SerialNumber", "FirmwareVersion", "ImageDescription",
+    "XPComment", "XPKeywords"
+})
+
+
+@filesystem_dependent
 def validate(cfg: "ConfigManager") -> bool:
     """
     Validates the configuration for applying EXIF metadata to images.
@@ -41,17 +49,13 @@ def validate(cfg: "ConfigManager") -> bool:
         error_count += 1
 
     # ✅ Ensure all required metadata fields are defined
-    required_metadata_fields = [
-        "Artist", "Copyright", "Software", "Make", "Model", "SerialNumber", "FirmwareVersion", "ImageDescription",
-        "XPComment", "XPKeywords"
-    ]
-    missing_fields = [field for field in required_metadata_fields if field not in tags]
+    missing_fields = REQUIRED_METADATA_FIELDS.difference(tags)
     if missing_fields:
         logger.error(f"Missing required metadata_tags fields: {sorted(missing_fields)}",
                      error_type=ConfigValidationError)
         error_count += 1
 
-    extra_tags = set(tags.keys()) - set(required_metadata_fields)
+    extra_tags = tags.keys() - REQUIRED_METADATA_FIELDS
     if extra_tags:
         logger.info(f"Found extra metadata_tags fields not in required list: {sorted(extra_tags)}")
 
@@ -26,6 +26,8 @@ from utils.validators.common_validators import (
     check_duplicate_field_names
 )
 
+_TEMPLATE_REQUIRED_KEYS = frozenset({"auto_create_oid_template", "templates_dir", "gdb_path", "template_name"})
+
 
 def validate(cfg: "ConfigManager") -> bool:
     from utils.manager.config_manager import ConfigManager
@@ -50,7 +52,7 @@ def validate(cfg: "ConfigManager") -> bool:
 
     if not check_required_keys(
         template_cfg,
-        ["auto_create_oid_template", "templates_dir", "gdb_path", "template_name"],
+        _TEMPLATE_REQUIRED_KEYS,
         "oid_schema_template.template", cfg):
         error_count += 1
 
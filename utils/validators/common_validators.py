@@ -18,13 +18,18 @@
 # =============================================================================
 
 from __future__ import annotations
+import os
 import shutil
-from typing import Union, Tuple, Type, Literal, get_args
-from pathlib import Path
+from collections import Counter
+from contextlib import contextmanager
+from typing import Union, Tuple, Type, Literal, get_args, TYPE_CHECKING
 
 from utils.shared.rmi_exceptions import ConfigValidationError
 from utils.shared.expression_utils import resolve_expression
 
+if TYPE_CHECKING:
+    from utils.manager.config_manager import ConfigManager
+
 
 def validate_type(value, context: str, expected_type: Union[Type, Tuple[Type, ...]], cfg: ConfigManager):
     """
@@ -39,23 +44,20 @@ def validate_type(value, context: str, expected_type: Union[Type, Tuple[Type, ..
     Returns:
         bool: True if validation passed, False otherwise.
     """
-    from utils.manager.config_manager import ConfigManager
-    logger = cfg.get_logger()
-
-    if not isinstance(value, expected_type):
-        actual_type = type(value).__name__
+    if isinstance(value, expected_type):
+        return True
 
-        # Check if expected_type is a tuple, otherwise treat it as a single type
-        if isinstance(expected_type, tuple):
-            expected = ", ".join(t.__name__ for t in expected_type)
-        else:
-            expected = expected_type.__name__  # Just the name of the type if it's not a tuple
+    actual_type = type(value).__name__
 
-        logger.error(f"{context} must be of type {expected}, but got {actual_type}",
-                     error_type=ConfigValidationError)
+    # Check if expected_type is a tuple, otherwise treat it as a single type
+    if isinstance(expected_type, tuple):
+        expected = ", ".join(t.__name__ for t in expected_type)
+    else:
+        expected = expected_type.__name__  # Just the name of the type if it's not a tuple
 
-        return False
-    return True
+    cfg.get_logger().error(f"{context} must be of type {expected}, but got {actual_type}",
+                           error_type=ConfigValidationError)
+    return False
 
 
 def validate_expression_block(block: dict, keys: list[str], cfg: ConfigManager,
@@ -71,7 +73,6 @@ def validate_expression_block(block: dict, keys: list[str], cfg: ConfigManager,
     Returns:
         bool: True if validation passed, False otherwise.
     """
-    from utils.manager.config_manager import ConfigManager
     logger =cfg.get_logger()
     error_count = 0
 
@@ -106,12 +107,11 @@ def check_required_keys(d, keys, context, cfg: ConfigManager):
     Returns:
         bool: True if validation passed, False otherwise.
     """
-    from utils.manager.config_manager import ConfigManager
-    logger =cfg.get_logger()
-
+    # Keys are checked in the caller's order, so the first missing key reported is the first one listed
+    present = set(d)
     for key in keys:
-        if key not in d:
-            logger.error(f"{context}.{key} is required", error_type=ConfigValidationError)
+        if key not in present:
+            cfg.get_logger().error(f"{context}.{key} is required", error_type=ConfigValidationError)
     return True
 
 
@@ -125,7 +125,6 @@ def validate_config_section(cfg: ConfigManager, path: str, expected_type=dict):
     Returns:
         bool: True if validation passed, False otherwise.
     """
-    from utils.manager.config_manager import ConfigManager
     logger = cfg.get_logger()
 
     if not path:
@@ -152,12 +151,35 @@ def validate_config_section(cfg: ConfigManager, path: str, expected_type=dict):
 
 
 
+# Successfully resolved config expressions per ConfigManager, shared by all validators during one validation pass
+_RESOLVED_EXPRESSIONS: "dict[ConfigManager, dict]" = {}
+
+
+@contextmanager
+def resolved_expression_scope(cfg: ConfigManager):
+    """
+    Reuses successful expression resolutions across validators for the duration of one validation pass.
+
+    Nested scopes for the same ConfigManager share the outer memo. It is dropped when the outermost scope exits, so
+    a config changed between validations is always resolved afresh.
+    """
+    if cfg in _RESOLVED_EXPRESSIONS:
+        yield
+        return
+    _RESOLVED_EXPRESSIONS[cfg] = {}
+    try:
+        yield
+    finally:
+        _RESOLVED_EXPRESSIONS.pop(cfg, None)
+
+
 def try_resolve_config_expression(expr: str, context: str, cfg: ConfigManager, expected_type=None):
     """
     Attempts to resolve a configuration expression and optionally checks its type.
 
     If the expression starts with "field.", resolution is skipped. If resolution fails or the resolved value does not
-    match the expected type (if provided), an error is logged and None is returned.
+    match the expected type (if provided), an error is logged and None is returned. Inside resolved_expression_scope,
+    successful resolutions are reused for later calls with the same ConfigManager.
 
     Args:
         expr: The configuration expression to resolve.
@@ -168,7 +190,6 @@ def try_resolve_config_expression(expr: str, context: str, cfg: ConfigManager, e
     Returns:
         The resolved value if successful and of the expected type, or None if resolution fails or is skipped.
     """
-    from utils.manager.config_manager import ConfigManager
     logger = cfg.get_logger()
 
     if expr is None or not isinstance(expr, str):
@@ -177,8 +198,14 @@ def try_resolve_config_expression(expr: str, context: str, cfg: ConfigManager, e
     if expr.startswith("field."):
         return None  # Skip resolution of field expressions
 
+    resolved = _RESOLVED_EXPRESSIONS.get(cfg)
     try:
-        result = resolve_expression(expr, cfg=cfg)
+        if resolved is not None and expr in resolved:
+            result = resolved[expr]
+        else:
+            result = resolve_expression(expr, cfg=cfg)
+            if resolved is not None:
+                resolved[expr] = result
         if expected_type and not isinstance(result, expected_type):
             logger.error(f"{context}: resolved value must be of type {expected_type.__name__}, "
                          f"got {type(result).__name__}", error_type=ConfigValidationError)
@@ -194,7 +221,8 @@ EsriFieldType = Literal[
     "BLOB", "GUID", "RASTER"
 ]
 
-VALID_FIELD_TYPES = set(get_args(EsriFieldType))  # auto-derived at runtime
+VALID_FIELD_TYPES = frozenset(get_args(EsriFieldType))  # auto-derived at runtime
+_VALID_FIELD_TYPES_MSG = ", ".join(sorted(VALID_FIELD_TYPES))
 
 
 def validate_field_block(field_block: dict, cfg: ConfigManager, context: str = "field"):
@@ -208,7 +236,6 @@ def validate_field_block(field_block: dict, cfg: ConfigManager, context: str = "
     Returns:
         bool: True if validation passed, False otherwise.
     """
-    from utils.manager.config_manager import ConfigManager
     logger = cfg.get_logger()
     error_count = 0
 
@@ -226,7 +253,7 @@ def validate_field_block(field_block: dict, cfg: ConfigManager, context: str = "
 
     if ftype not in VALID_FIELD_TYPES:
         logger.error(f"{context}: Invalid field type '{ftype}'. Must be one of: "
-                     f"{', '.join(sorted(VALID_FIELD_TYPES))}", error_type=ConfigValidationError)
+                     f"{_VALID_FIELD_TYPES_MSG}", error_type=ConfigValidationError)
         error_count += 1
 
     if "length" in field_block:
@@ -255,6 +282,58 @@ def validate_field_block(field_block: dict, cfg: ConfigManager, context: str = "
     return error_count == 0
 
 
+# (path, script base) -> (resolved file, its modification time) for paths already found on disk or PATH. A hit is
+# confirmed with one stat of the resolved file, so a removed, moved or replaced file is looked up again; misses are
+# not cached so fixes are picked up immediately
+_EXISTING_FILES: dict = {}
+
+
+def _path_mtime(path: str):
+    """Returns the modification time of path, or None if it no longer exists."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _file_or_command_exists(path: str, script_base: str) -> bool:
+    """
+    Returns True if path is a file (absolute, or relative to the cwd or script base) or a command on the PATH.
+    """
+    key = (path, script_base)
+    cached = _EXISTING_FILES.get(key)
+    if cached and _path_mtime(cached[0]) == cached[1]:
+        return True
+
+    candidates = [path]
+    if not os.path.isabs(path):
+        candidates.append(os.path.join(script_base, path))
+
+    resolved = next((candidate for candidate in candidates if os.path.isfile(candidate)), None) or shutil.which(path)
+    if not resolved:
+        _EXISTING_FILES.pop(key, None)
+        return False
+    stamp = _path_mtime(resolved)
+    if stamp is not None:
+        _EXISTING_FILES[key] = (resolved, stamp)
+    return True
+
+
+def filesystem_dependent(validator):
+    """
+    Marks a tool validator whose verdict depends on files or executables on disk rather than on the config contents
+    alone. ConfigManager never serves such validators from its validation cache.
+
+    Args:
+        validator: The tool validator function.
+
+    Returns:
+        The same validator, flagged with `uses_filesystem = True`.
+    """
+    validator.uses_filesystem = True
+    return validator
+
+
 def check_file_exists(path, context, cfg: ConfigManager):
     """
     Validates that a given executable or file path is either:
@@ -265,25 +344,12 @@ def check_file_exists(path, context, cfg: ConfigManager):
     Returns:
         bool: True if validation passed, False otherwise.
     """
-    from utils.manager.config_manager import ConfigManager
     logger = cfg.get_logger()
 
     if path == "DISABLED":
         return True
 
-    path_obj = Path(path)
-
-    # Check absolute or relative to script base
-    candidates = [path_obj]
-    if not path_obj.is_absolute():
-        candidates.append(cfg.paths.script_base / path_obj)
-
-    for candidate in candidates:
-        if candidate.is_file():
-            return True
-
-    # Check if it's a valid command
-    if shutil.which(path):
+    if _file_or_command_exists(str(path), str(cfg.paths.script_base)):
         return True
 
     # Otherwise raise error
@@ -292,6 +358,23 @@ def check_file_exists(path, context, cfg: ConfigManager):
     return False
 
 
+def _iter_schema_field_names(cfg: ConfigManager, registry: dict):
+    """
+    Yields every field name the OID schema would define: registry fields in the enabled 'standard' and
+    'not_applicable' categories, followed by the config-defined 'mosaic_fields', 'linear_ref_fields', and
+    'custom_fields' blocks. Missing names are yielded as None.
+    """
+    esri_defaults = cfg.get("oid_schema_template.esri_default", {})
+    for field in registry.values():
+        category = field.get("category")
+        if category in ("standard", "not_applicable") and esri_defaults.get(category, True):
+            yield field.get("name")
+
+    for block_key in ("mosaic_fields", "linear_ref_fields", "custom_fields"):
+        for field in cfg.get(f"oid_schema_template.{block_key}", {}).values():
+            yield field.get("name")
+
+
 def check_duplicate_field_names(cfg: ConfigManager, registry: dict):
     """
     Checks for duplicate field names across the field registry and config-defined schema blocks.
@@ -303,41 +386,10 @@ def check_duplicate_field_names(cfg: ConfigManager, registry: dict):
     Returns:
         bool: True if validation passed, False otherwise.
     """
-    from utils.manager.config_manager import ConfigManager
     logger = cfg.get_logger()
 
-    seen = set()
-    duplicates = set()
-
-    esri_defaults = cfg.get("oid_schema_template.esri_default", {})
-
-    def add_and_check(field_name, source):
-        """
-        Adds a name to the set of seen names and records it as a duplicate if already present.
-
-        Args:
-            field_name: The name to check and add.
-            source: The source associated with the name (unused in this function).
-        """
-        if field_name in seen:
-            duplicates.add(field_name)
-        seen.add(field_name)
-
-    # 1. Check ESRI registry (based on esri_default options)
-    for key, field in registry.items():
-        category = field.get("category")
-        if category in {"standard", "not_applicable"} and esri_defaults.get(category, True):
-            fname = field.get("name")
-            if fname:
-                add_and_check(fname, f"registry.{key}")
-
-    # 2. Check config-defined schema blocks
-    for block_key in ["mosaic_fields", "linear_ref_fields", "custom_fields"]:
-        block = cfg.get(f"oid_schema_template.{block_key}", {})
-        for key, field in block.items():
-            fname = field.get("name")
-            if fname:
-                add_and_check(fname, f"{block_key}.{key}")
+    counts = Counter(name for name in _iter_schema_field_names(cfg, registry) if name)
+    duplicates = {name for name, count in counts.items() if count > 1}
 
     # Report duplicates
     if duplicates:
@@ -370,7 +422,6 @@ def validate_keys_with_types(
     Returns:
         int: Number of validation errors encountered.
     """
-    from utils.manager.config_manager import ConfigManager
     logger = cfg.get_logger()
     error_count = 0
 
@@ -20,10 +20,14 @@
 from utils.shared.rmi_exceptions import ConfigValidationError
 from utils.validators.common_validators import (
     validate_type,
-    check_file_exists
+    check_file_exists,
+    filesystem_dependent
 )
 
+VALID_GEODBS = frozenset({"default", "geolocation500", "geocustom"})
 
+
+@filesystem_dependent
 def validate(cfg: "ConfigManager") -> bool:
     from utils.manager.config_manager import ConfigManager
     """
@@ -53,9 +57,8 @@ def validate(cfg: "ConfigManager") -> bool:
         error_count += 1
 
     # ✅ Validate database selection
-    valid_dbs = {"default", "geolocation500", "geocustom"}
-    if db not in valid_dbs:
-        logger.error(f"Unsupported geocoding.exiftool_geodb: {db}. Must be one of: {sorted(valid_dbs)}",
+    if db not in VALID_GEODBS:
+        logger.error(f"Unsupported geocoding.exiftool_geodb: {db}. Must be one of: {sorted(VALID_GEODBS)}",
                      error_type=ConfigValidationError)
         error_count += 1
 
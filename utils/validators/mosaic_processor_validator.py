@@ -16,10 +16,11 @@
 # Notes:                Used for validation of mosaic processor settings and executable paths.
 # =============================================================================
 
-from utils.validators.common_validators import validate_type
+from utils.validators.common_validators import validate_type, filesystem_dependent
 from utils.shared.rmi_exceptions import ConfigValidationError
 
 
+@filesystem_dependent
 def validate(cfg: "ConfigManager") -> bool:
     from utils.manager.config_manager import ConfigManager
     """
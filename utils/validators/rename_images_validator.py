@@ -17,6 +17,7 @@
 # Notes:                Used for validation of filename formats and dynamic parts for output images.
 # =============================================================================
 import string
+from functools import lru_cache
 
 from utils.shared.rmi_exceptions import ConfigValidationError
 from utils.validators.common_validators import (
@@ -26,6 +27,12 @@ from utils.validators.common_validators import (
 )
 
 
+@lru_cache(maxsize=32)
+def _format_placeholders(fmt_str: str) -> frozenset:
+    """Returns the replacement field names of a str.format pattern; raises ValueError if the pattern is malformed."""
+    return frozenset(fname for _, fname, _, _ in string.Formatter().parse(fmt_str) if fname)
+
+
 def validate(cfg: "ConfigManager") -> bool:
     from utils.manager.config_manager import ConfigManager
     """
@@ -65,7 +72,12 @@ def validate(cfg: "ConfigManager") -> bool:
         if fmt_str is None:
             logger.warning(f"'image_output.filename_settings.{label}' is not defined.")
             continue
-        placeholders = {fname for _, fname, _, _ in string.Formatter().parse(fmt_str) if fname}
+        try:
+            placeholders = _format_placeholders(fmt_str)
+        except ValueError as e:
+            logger.error(f"Filename {label} is not a valid format string: {e}", error_type=ConfigValidationError)
+            error_count += 1
+            continue
         part_keys = set(parts.keys())
         missing = placeholders - part_keys
         extra = part_keys - placeholders
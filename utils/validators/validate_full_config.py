@@ -96,10 +96,14 @@ def validate_full_config(cfg: 'ConfigManager', logger=None) -> bool:
         logger.error(str(e), error_type=ConfigValidationError)
         errors.append(str(e))
 
-    # Tool-specific validation
-    for tool, validator in getattr(cfg, 'TOOL_VALIDATORS', {}).items():
+    # Tool-specific validation (through validate_tool_config, so tools that already passed on identical config
+    # contents are not re-validated); the config digest is computed once, and only if some tool can use the cache
+    digest = None
+    for tool in getattr(cfg, 'TOOL_VALIDATORS', {}):
+        if digest is None and cfg.validation_cacheable(tool):
+            digest = cfg.validation_digest()
         try:
-            validator(cfg)
+            cfg.validate_tool_config(tool, digest=digest)
             logger.success(f"[{tool} validation] passed.", indent=1)
         except ConfigValidationError as e:
             logger.error(f"[{tool} validation] {e}", error_type=ConfigValidationError, indent=1)